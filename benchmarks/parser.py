@@ -0,0 +1,56 @@
+import random
+import sys
+import time
+import typing
+
+from solvent import mapping
+from solvent.mapping import parser
+
+
+TEMPLATES = (
+    "Implication(Connection.source.value, Connection.destination.value)",
+    "Equivalence(Connection.source.value, Or(Connection.destinations.value))",
+    "Xor(Connection.destinations.value)",
+    "Inferior(Node.size, Addition(Node.minimum, {number}), Inclusive)",
+    "Integer(Range(0, {number}))",
+    "And(Node.value, Negation(Different(Node.size, {number})))",
+    "Boolean({boolean})",
+)
+
+
+def rules(count: int) -> list[str]:
+    generator = random.Random(count)
+
+    return [
+        generator.choice(TEMPLATES).format(
+            number=generator.randint(0, 1000),
+            boolean=generator.choice(["true", "false"]),
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(parse: typing.Callable[[str], typing.Any], codes: list[str]) -> float:
+    start = time.perf_counter()
+
+    for code in codes:
+        parse(code)
+
+    return time.perf_counter() - start
+
+
+def main(count: int = 5000) -> None:
+    codes = rules(count)
+    metamodel = mapping.get_metamodel()
+
+    textx = measure(metamodel.model_from_str, codes)
+    fast = measure(parser.parse, codes)
+
+    print(f"rules:   {count}")
+    print(f"textx:   {textx:.3f}s ({count / textx:,.0f} rules/s)")
+    print(f"fast:    {fast:.3f}s ({count / fast:,.0f} rules/s)")
+    print(f"speedup: {textx / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,145 @@
+import array
+import typing
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+indices = typing.Union[memoryview, "numpy.ndarray"]
+
+
+def _export(data: array.array) -> indices:
+    if numpy is not None:
+        return numpy.frombuffer(data, dtype=numpy.int64)
+
+    return memoryview(data)
+
+
+class CSR:
+    def __init__(self, offsets: array.array, columns: array.array) -> None:
+        self._offsets = offsets
+        self._columns = columns
+
+    @classmethod
+    def from_pairs(cls, size: int, rows: array.array, columns: array.array) -> "CSR":
+        if numpy is not None and len(rows):
+            return cls._from_pairs_numpy(size, rows, columns)
+
+        offsets = array.array("q", bytes(8 * (size + 1)))
+
+        for row in rows:
+            offsets[row + 1] += 1
+
+        for row in range(size):
+            offsets[row + 1] += offsets[row]
+
+        cursor = offsets[:-1]
+        ordered = array.array("q", bytes(8 * len(columns)))
+
+        for row, column in zip(rows, columns):
+            ordered[cursor[row]] = column
+            cursor[row] += 1
+
+        return cls(offsets, ordered)
+
+    @classmethod
+    def _from_pairs_numpy(
+        cls, size: int, rows: array.array, columns: array.array
+    ) -> "CSR":
+        row_array = numpy.frombuffer(rows, dtype=numpy.int64)
+        column_array = numpy.frombuffer(columns, dtype=numpy.int64)
+
+        offsets = numpy.zeros(size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(row_array, minlength=size), out=offsets[1:])
+        ordered = column_array[numpy.argsort(row_array, kind="stable")]
+
+        return cls(
+            array.array("q", offsets.tobytes()), array.array("q", ordered.tobytes())
+        )
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def offsets(self) -> indices:
+        return _export(self._offsets)
+
+    @property
+    def columns(self) -> indices:
+        return _export(self._columns)
+
+    def row(self, index: int) -> indices:
+        if index >= len(self):
+            return _export(self._columns)[0:0]
+
+        return _export(self._columns)[self._offsets[index] : self._offsets[index + 1]]
+
+    def degree(self, index: int) -> int:
+        if index >= len(self):
+            return 0
+
+        return self._offsets[index + 1] - self._offsets[index]
+
+
+class Adjacency:
+    def __init__(
+        self,
+        sources: CSR,
+        destinations: CSR,
+        connection_sources: array.array,
+        connection_destinations: CSR,
+    ) -> None:
+        self.sources = sources
+        self.destinations = destinations
+        self.connection_destinations = connection_destinations
+        self._connection_sources = connection_sources
+
+    @classmethod
+    def from_graph(cls, graph: typing.Any) -> "Adjacency":
+        node_count = len(graph._node_ids)
+        connection_count = len(graph._connection_ids)
+
+        connection_sources = array.array("q", [-1]) * connection_count
+        source_rows = array.array("q")
+        source_columns = array.array("q")
+        destination_rows = array.array("q")
+        destination_columns = array.array("q")
+
+        for connection in graph._connection_table.values():
+            connection_index = graph._connection_index[connection.id]
+            source_index = graph._node_index[connection.source.id]
+
+            connection_sources[connection_index] = source_index
+            source_rows.append(source_index)
+            source_columns.append(connection_index)
+
+            for destination in connection.destinations:
+                destination_rows.append(connection_index)
+                destination_columns.append(graph._node_index[destination.id])
+
+        return cls(
+            CSR.from_pairs(node_count, source_rows, source_columns),
+            CSR.from_pairs(node_count, destination_columns, destination_rows),
+            connection_sources,
+            CSR.from_pairs(connection_count, destination_rows, destination_columns),
+        )
+
+    @property
+    def connection_sources(self) -> indices:
+        return _export(self._connection_sources)
+
+    def successors(self, index: int) -> list[int]:
+        return [
+            destination
+            for connection in self.sources.row(index)
+            for destination in self.connection_destinations.row(connection)
+        ]
+
+    def predecessors(self, index: int) -> list[int]:
+        return [
+            self._connection_sources[connection]
+            for connection in self.destinations.row(index)
+        ]
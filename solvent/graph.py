@@ -1,11 +1,26 @@
+import copy
 import typing
 import uuid
+import weakref
+
+from solvent import adjacency, hashing
 
 
 component = typing.Union["Node", "Connection"]
+observer = typing.Callable[
+    [str, typing.Optional[component], typing.Optional[component]], None
+]
+
+CROSS_TREE = ("excludes", "requires")
+
+STRUCTURAL_KEYS = ("source", "destinations", "destination")
+
+MISSING = object()
 
 
 class Node:
+    __slots__ = ("parameters",)
+
     def __init__(self, **kwargs: dict[str, typing.Any]) -> None:
         self.validate_id(kwargs)
 
@@ -15,11 +30,22 @@ class Node:
         if "id" not in parameters:
             raise ValueError()
 
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        return self.parameters.get(name, default)
+
     def __getattr__(self, name: str) -> typing.Any:
-        return self.parameters[name]
+        if name == "parameters":
+            raise AttributeError(name)
+
+        try:
+            return self.parameters[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
 
 class Connection:
+    __slots__ = ("parameters",)
+
     def __init__(self, **kwargs: dict[str, typing.Any]) -> None:
         self.validate_id(kwargs)
         self.validate_source(kwargs)
@@ -53,48 +79,833 @@ class Connection:
             if not isinstance(destination, Node):
                 raise ValueError()
 
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        return self.parameters.get(name, default)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name == "parameters":
+            raise AttributeError(name)
+
+        try:
+            return self.parameters[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class Schema:
+    __slots__ = ("keys", "index", "__weakref__")
+
+    _registry: "weakref.WeakValueDictionary[tuple[str, ...], Schema]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = keys
+        self.index = {key: position for position, key in enumerate(keys)}
+
+    @classmethod
+    def intern(cls, keys: tuple[str, ...]) -> "Schema":
+        schema = cls._registry.get(keys)
+
+        if schema is None:
+            schema = cls(keys)
+            cls._registry[keys] = schema
+
+        return schema
+
+
+class CompactNode(Node):
+    __slots__ = ("_schema", "_row")
+
+    def __init__(self, **kwargs: dict[str, typing.Any]) -> None:
+        self.validate_id(kwargs)
+
+        self._schema = Schema.intern(tuple(kwargs))
+        self._row = tuple(kwargs.values())
+
+    @property
+    def parameters(self) -> dict[str, typing.Any]:
+        return dict(zip(self._schema.keys, self._row))
+
+    def __getstate__(self) -> tuple[tuple[str, ...], tuple[typing.Any, ...]]:
+        return self._schema.keys, self._row
+
+    def __setstate__(
+        self, state: tuple[tuple[str, ...], tuple[typing.Any, ...]]
+    ) -> None:
+        self._schema = Schema.intern(state[0])
+        self._row = state[1]
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        position = self._schema.index.get(name)
+
+        return default if position is None else self._row[position]
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name in ("_schema", "_row"):
+            raise AttributeError(name)
+
+        try:
+            return self._row[self._schema.index[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class CompactConnection(Connection):
+    __slots__ = ("_schema", "_row")
+
+    def __init__(self, **kwargs: dict[str, typing.Any]) -> None:
+        self.validate_id(kwargs)
+        self.validate_source(kwargs)
+        self.validate_destinations(kwargs)
+
+        kwargs.pop("destination", None)
+
+        self._schema = Schema.intern(tuple(kwargs))
+        self._row = tuple(kwargs.values())
+
+    @property
+    def parameters(self) -> dict[str, typing.Any]:
+        parameters = dict(zip(self._schema.keys, self._row))
+        parameters["destination"] = parameters["destinations"][0]
+
+        return parameters
+
+    def __getstate__(self) -> tuple[tuple[str, ...], tuple[typing.Any, ...]]:
+        return self._schema.keys, self._row
+
+    def __setstate__(
+        self, state: tuple[tuple[str, ...], tuple[typing.Any, ...]]
+    ) -> None:
+        self._schema = Schema.intern(state[0])
+        self._row = state[1]
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        if name == "destination":
+            return self._row[self._schema.index["destinations"]][0]
+
+        position = self._schema.index.get(name)
+
+        return default if position is None else self._row[position]
+
     def __getattr__(self, name: str) -> typing.Any:
-        return self.parameters[name]
+        if name in ("_schema", "_row"):
+            raise AttributeError(name)
+
+        if name == "destination":
+            return self._row[self._schema.index["destinations"]][0]
+
+        try:
+            return self._row[self._schema.index[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _compact(
+    nodes: typing.Iterable[Node], connections: typing.Iterable[Connection]
+) -> tuple[list[Node], list[Connection]]:
+    table = {}
+
+    def convert(node: Node) -> Node:
+        if node.id not in table:
+            table[node.id] = (
+                node
+                if isinstance(node, CompactNode)
+                else CompactNode(**node.parameters)
+            )
+
+        return table[node.id]
+
+    compact_nodes = [convert(node) for node in nodes]
+    compact_connections = []
+
+    for connection in connections:
+        parameters = dict(connection.parameters)
+        parameters["source"] = convert(connection.source)
+        parameters["destinations"] = [
+            convert(destination) for destination in connection.destinations
+        ]
+
+        compact_connections.append(CompactConnection(**parameters))
+
+    return compact_nodes, compact_connections
+
+
+class _Bucket(dict):
+    __slots__ = ("generation",)
+
+    def __init__(
+        self, generation: int, items: typing.Iterable[tuple[uuid.UUID, component]] = ()
+    ) -> None:
+        super().__init__(items)
+        self.generation = generation
+
+
+def _hashable(value: typing.Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+def _hierarchical(connection: Connection) -> bool:
+    return connection.get("type") not in CROSS_TREE
 
 
 class MGraph:
     def __init__(
         self, nodes: list[Node] = None, connections: list[Connection] = None
     ) -> None:
-        self.nodes = nodes if nodes else []
-        self.connections = connections if connections else []
-
-        self._node_table = {node.id: node for node in self.nodes}
-        self._connection_table = {
-            connection.id: connection for connection in self.connections
-        }
+        self._node_table = {}
+        self._connection_table = {}
 
         self._sources_table = {}
         self._destinations_table = {}
 
-        for connection in self.connections:
-            self.add_connection(connection)
+        self._node_index = {}
+        self._node_ids = []
+        self._connection_index = {}
+        self._connection_ids = []
 
-    def add_node(self, node: Node) -> None:
-        self.nodes.append(node)
+        self._node_indexes = {}
+        self._connection_indexes = {}
+
+        self._node_hashes = {}
+        self._connection_hashes = {}
+        self._subtree_hashes = {}
+
+        self.version = 0
+        self._cache = {}
+
+        self._generation = 0
+        self._shared = False
+        self._frozen = False
+        self._reader = None
+        self._listeners = []
+
+        self._load(nodes if nodes else [], connections if connections else [])
+
+    @classmethod
+    def from_components(
+        cls,
+        nodes: typing.Iterable[Node],
+        connections: typing.Iterable[Connection],
+        compact: bool = False,
+    ) -> "MGraph":
+        if compact:
+            return cls(*_compact(nodes, connections))
+
+        return cls(list(nodes), list(connections))
+
+    @property
+    def nodes(self) -> list[Node]:
+        return list(self._node_table.values())
+
+    @property
+    def connections(self) -> list[Connection]:
+        return list(self._connection_table.values())
+
+    def iter_nodes(self) -> typing.Iterator[Node]:
+        return iter(self._node_table.values())
+
+    def iter_connections(self) -> typing.Iterator[Connection]:
+        return iter(self._connection_table.values())
+
+    def _load(self, nodes: list[Node], connections: list[Connection]) -> None:
+        for node in nodes:
+            self._insert_node(node)
+
+        for connection in connections:
+            self._insert_connection(connection)
+
+        self._touch()
+
+    def _touch(self) -> None:
+        self.version += 1
+        self._cache = {}
+
+    def _own(self) -> None:
+        if self._frozen:
+            raise TypeError()
+
+        if not self._shared:
+            return
+
+        self._shared = False
+
+        if self._reader is None or self._reader() is None:
+            self._generation -= 1
+            return
+
+        self._node_table = dict(self._node_table)
+        self._connection_table = dict(self._connection_table)
+        self._sources_table = dict(self._sources_table)
+        self._destinations_table = dict(self._destinations_table)
+
+        self._node_index = dict(self._node_index)
+        self._node_ids = list(self._node_ids)
+        self._connection_index = dict(self._connection_index)
+        self._connection_ids = list(self._connection_ids)
+
+        self._node_indexes = {
+            key: dict(index) for key, index in self._node_indexes.items()
+        }
+        self._connection_indexes = {
+            key: dict(index) for key, index in self._connection_indexes.items()
+        }
+
+        self._node_hashes = dict(self._node_hashes)
+        self._connection_hashes = dict(self._connection_hashes)
+        self._subtree_hashes = dict(self._subtree_hashes)
+
+    def _bucket(
+        self, table: dict[typing.Hashable, _Bucket], key: typing.Hashable
+    ) -> _Bucket:
+        bucket = table.get(key)
+
+        if bucket is None or bucket.generation != self._generation:
+            bucket = _Bucket(self._generation, bucket.items() if bucket else ())
+            table[key] = bucket
+
+        return bucket
+
+    def snapshot(self) -> "MGraph":
+        if self._frozen:
+            return self
+
+        reader = self._reader() if self._reader is not None else None
+
+        if not self._shared:
+            self._generation += 1
+            self._shared = True
+        elif reader is not None:
+            return reader
+
+        snapshot = copy.copy(self)
+        snapshot._frozen = True
+        snapshot._reader = None
+        snapshot._listeners = []
+        snapshot._cache = dict(self._cache)
+
+        self._reader = weakref.ref(snapshot)
+
+        return snapshot
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def _intern_node(self, id: uuid.UUID) -> int:
+        index = self._node_index.get(id)
+
+        if index is None:
+            index = len(self._node_ids)
+            self._node_index[id] = index
+            self._node_ids.append(id)
+
+        return index
+
+    def _insert_node(self, node: Node) -> bool:
+        if node.id in self._node_table:
+            return False
+
+        self._index(self._node_indexes, node)
         self._node_table[node.id] = node
+        self._intern_node(node.id)
+        self._invalidate_node(node.id)
 
-    def add_connection(self, connection: Connection) -> None:
-        if connection.id not in self.connections:
-            self.connections.append(connection)
+        return True
+
+    def _insert_connection(self, connection: Connection) -> bool:
+        if connection.id in self._connection_table:
+            return False
 
+        self._index(self._connection_indexes, connection)
         self._connection_table[connection.id] = connection
 
-        if connection.source.id not in self._sources_table:
-            self._sources_table[connection.source.id] = []
+        self._connection_index[connection.id] = len(self._connection_ids)
+        self._connection_ids.append(connection.id)
 
-        self._sources_table[connection.source.id].append(connection)
+        self._link(connection)
+        self._invalidate_subtree(connection.source.id)
+
+        return True
+
+    def _link(self, connection: Connection) -> None:
+        self._intern_node(connection.source.id)
+        self._bucket(self._sources_table, connection.source.id)[
+            connection.id
+        ] = connection
 
         for destination in connection.destinations:
-            if destination.id not in self._destinations_table:
-                self._destinations_table[destination.id] = []
+            self._intern_node(destination.id)
+            self._bucket(self._destinations_table, destination.id)[
+                connection.id
+            ] = connection
+
+    def _unlink(self, connection: Connection) -> None:
+        self._discard(self._sources_table, connection.source.id, connection.id)
+
+        for destination in connection.destinations:
+            self._discard(self._destinations_table, destination.id, connection.id)
+
+    def _discard(
+        self,
+        table: dict[typing.Hashable, dict[uuid.UUID, component]],
+        key: typing.Hashable,
+        id: uuid.UUID,
+    ) -> None:
+        components = table.get(key)
+
+        if components is None or id not in components:
+            return
+
+        components = self._bucket(table, key)
+        del components[id]
+
+        if not components:
+            del table[key]
+
+    def _index(
+        self,
+        indexes: dict[str, dict[typing.Hashable, dict[uuid.UUID, component]]],
+        component: component,
+    ) -> None:
+        if not indexes:
+            return
+
+        for key, index in indexes.items():
+            value = component.get(key, MISSING)
+
+            if value is not MISSING and _hashable(value):
+                self._bucket(index, value)[component.id] = component
+
+    def _unindex(
+        self,
+        indexes: dict[str, dict[typing.Hashable, dict[uuid.UUID, component]]],
+        component: component,
+    ) -> None:
+        if not indexes:
+            return
+
+        for key, index in indexes.items():
+            value = component.get(key, MISSING)
+
+            if value is not MISSING and _hashable(value):
+                self._discard(index, value, component.id)
+
+    def _incident(self, id: uuid.UUID) -> list[Connection]:
+        connections = dict(self._sources_table.get(id, {}))
+        connections.update(self._destinations_table.get(id, {}))
+
+        return list(connections.values())
+
+    def _replace_connection(self, old: Connection, new: Connection) -> None:
+        if old.source.id != new.source.id:
+            self._discard(self._sources_table, old.source.id, old.id)
+
+        destinations = {destination.id for destination in new.destinations}
+
+        for destination in old.destinations:
+            if destination.id not in destinations:
+                self._discard(self._destinations_table, destination.id, old.id)
+
+        self._unindex(self._connection_indexes, old)
+        self._connection_table[new.id] = new
+        self._index(self._connection_indexes, new)
+        self._link(new)
+
+        self._connection_hashes.pop(new.id, None)
+        self._invalidate_subtree(old.source.id)
+        self._invalidate_subtree(new.source.id)
+
+    def subscribe(self, listener: observer) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: observer) -> None:
+        self._listeners.remove(listener)
+
+    def _notify(
+        self,
+        event: str,
+        old: typing.Optional[component],
+        new: typing.Optional[component],
+    ) -> None:
+        for listener in list(self._listeners):
+            listener(event, old, new)
+
+    def add_node(self, node: Node) -> None:
+        self._own()
+
+        if self._insert_node(node):
+            self._touch()
+            self._notify("add_node", None, node)
+
+    def add_connection(self, connection: Connection) -> None:
+        self._own()
+
+        if self._insert_connection(connection):
+            self._touch()
+            self._notify("add_connection", None, connection)
+
+    def remove_node(self, id: uuid.UUID) -> None:
+        self._own()
+
+        if id not in self._node_table:
+            raise ValueError()
 
-            self._destinations_table[destination.id].append(connection)
+        self._invalidate_node(id)
+        events = []
+
+        for connection in self._incident(id):
+            destinations = [
+                destination
+                for destination in connection.destinations
+                if destination.id != id
+            ]
+
+            if connection.source.id == id or not destinations:
+                self._delete_connection(connection)
+                events.append(("remove_connection", connection, None))
+                continue
+
+            parameters = dict(connection.parameters)
+            parameters["destinations"] = destinations
+            shrunk = type(connection)(**parameters)
+
+            self._replace_connection(connection, shrunk)
+            events.append(("retarget_connection", connection, shrunk))
+
+        node = self._node_table.pop(id)
+        self._unindex(self._node_indexes, node)
+        self._node_ids[self._node_index.pop(id)] = None
+
+        self._touch()
+
+        for event in events:
+            self._notify(*event)
+
+        self._notify("remove_node", node, None)
+
+    def remove_connection(self, id: uuid.UUID) -> None:
+        self._own()
+
+        if id not in self._connection_table:
+            raise ValueError()
+
+        connection = self._connection_table[id]
+        self._delete_connection(connection)
+
+        self._touch()
+        self._notify("remove_connection", connection, None)
+
+    def _delete_connection(self, connection: Connection) -> None:
+        self._invalidate_subtree(connection.source.id)
+        self._connection_hashes.pop(connection.id, None)
+        self._unlink(connection)
+        self._unindex(self._connection_indexes, connection)
+
+        del self._connection_table[connection.id]
+        self._connection_ids[self._connection_index.pop(connection.id)] = None
+
+    def update_node(self, id: uuid.UUID, **kwargs: dict[str, typing.Any]) -> Node:
+        self._own()
+
+        node = self._node_table.get(id)
+
+        if node is None:
+            raise ValueError()
+
+        if kwargs.get("id", id) != id:
+            raise ValueError()
+
+        updated = type(node)(**{**node.parameters, **kwargs})
+        self._unindex(self._node_indexes, node)
+        self._node_table[id] = updated
+        self._index(self._node_indexes, updated)
+        self._invalidate_node(id)
+
+        for connection in self._incident(id):
+            parameters = dict(connection.parameters)
+            parameters["source"] = (
+                updated if connection.source.id == id else connection.source
+            )
+            parameters["destinations"] = [
+                updated if destination.id == id else destination
+                for destination in connection.destinations
+            ]
+
+            self._replace_connection(connection, type(connection)(**parameters))
+
+        self._touch()
+        self._notify("update_node", node, updated)
+
+        return updated
+
+    def retarget_connection(
+        self,
+        id: uuid.UUID,
+        source: typing.Optional[uuid.UUID] = None,
+        destinations: typing.Optional[list[uuid.UUID]] = None,
+    ) -> Connection:
+        self._own()
+
+        connection = self._connection_table.get(id)
+
+        if connection is None:
+            raise ValueError()
+
+        parameters = dict(connection.parameters)
+
+        if source is not None:
+            parameters["source"] = self._require_node(source)
+
+        if destinations is not None:
+            parameters["destinations"] = [
+                self._require_node(destination) for destination in destinations
+            ]
+
+        retargeted = type(connection)(**parameters)
+        self._replace_connection(connection, retargeted)
+
+        self._touch()
+        self._notify("retarget_connection", connection, retargeted)
+
+        return retargeted
+
+    def _require_node(self, id: uuid.UUID) -> Node:
+        node = self._node_table.get(id)
+
+        if node is None:
+            raise ValueError()
+
+        return node
+
+    def create_index(self, key: str) -> None:
+        self._own()
+
+        if key in self._node_indexes:
+            return
+
+        self._node_indexes[key] = {}
+        self._connection_indexes[key] = {}
+
+        for node in self._node_table.values():
+            self._index({key: self._node_indexes[key]}, node)
+
+        for connection in self._connection_table.values():
+            self._index({key: self._connection_indexes[key]}, connection)
+
+    def drop_index(self, key: str) -> None:
+        self._own()
+
+        self._node_indexes.pop(key, None)
+        self._connection_indexes.pop(key, None)
+
+    def find_nodes(self, **kwargs: dict[str, typing.Any]) -> list[Node]:
+        return self._find(self._node_table, self._node_indexes, kwargs)
+
+    def find_connections(self, **kwargs: dict[str, typing.Any]) -> list[Connection]:
+        return self._find(self._connection_table, self._connection_indexes, kwargs)
+
+    def _find(
+        self,
+        table: dict[uuid.UUID, component],
+        indexes: dict[str, dict[typing.Hashable, dict[uuid.UUID, component]]],
+        conditions: dict[str, typing.Any],
+    ) -> list[component]:
+        buckets = []
+        scanned = {}
+
+        for key, value in conditions.items():
+            if key in indexes and _hashable(value):
+                bucket = indexes[key].get(value)
+
+                if bucket is None:
+                    return []
+
+                buckets.append(bucket)
+            else:
+                scanned[key] = value
+
+        if buckets:
+            buckets.sort(key=len)
+            candidates = buckets[0].values()
+        else:
+            candidates = table.values()
+
+        return [
+            candidate
+            for candidate in candidates
+            if all(candidate.id in bucket for bucket in buckets[1:])
+            and self._matches(candidate, scanned)
+        ]
+
+    def _matches(self, component: component, conditions: dict[str, typing.Any]) -> bool:
+        if not conditions:
+            return True
+
+        return all(
+            component.get(key, MISSING) == value for key, value in conditions.items()
+        )
+
+    def _invalidate_node(self, id: uuid.UUID) -> None:
+        self._node_hashes.pop(id, None)
+        self._invalidate_subtree(id)
+
+    def _invalidate_subtree(self, id: uuid.UUID) -> None:
+        stack = [id]
+
+        while stack:
+            current = stack.pop()
+
+            if self._subtree_hashes.pop(current, None) is None:
+                continue
+
+            for connection in self._destinations_table.get(current, {}).values():
+                if _hierarchical(connection):
+                    stack.append(connection.source.id)
+
+    def contains(self, id: uuid.UUID) -> bool:
+        return id in self._node_index
+
+    def children(self, id: uuid.UUID) -> list[uuid.UUID]:
+        return [
+            destination.id
+            for connection in self._sources_table.get(id, {}).values()
+            if _hierarchical(connection)
+            for destination in connection.destinations
+            if destination.id != id
+        ]
+
+    def roots(self) -> list[uuid.UUID]:
+        return self.cached("roots", MGraph._roots)
+
+    def _roots(self) -> list[uuid.UUID]:
+        return [
+            id
+            for id in self._node_index
+            if not any(
+                _hierarchical(connection) and connection.source.id != id
+                for connection in self._destinations_table.get(id, {}).values()
+            )
+        ]
+
+    def node_hash(self, id: uuid.UUID) -> bytes:
+        digest = self._node_hashes.get(id)
+
+        if digest is None:
+            node = self._node_table.get(id)
+            parameters = node.parameters if node is not None else {"id": id}
+            digest = hashing.digest(hashing.encode(parameters))
+            self._node_hashes[id] = digest
+
+        return digest
+
+    def connection_hash(self, id: uuid.UUID) -> bytes:
+        digest = self._connection_hashes.get(id)
+
+        if digest is None:
+            connection = self._connection_table[id]
+            parameters = {
+                key: value
+                for key, value in connection.parameters.items()
+                if key not in STRUCTURAL_KEYS
+            }
+            digest = hashing.digest(
+                hashing.encode(parameters),
+                hashing.encode(connection.source.id),
+                hashing.encode(
+                    [destination.id for destination in connection.destinations]
+                ),
+            )
+            self._connection_hashes[id] = digest
+
+        return digest
+
+    def subtree_hash(self, id: uuid.UUID) -> bytes:
+        stack = [(id, False)]
+        active = set()
+
+        while stack:
+            current, expanded = stack.pop()
+
+            if current in self._subtree_hashes:
+                continue
+
+            children = self.children(current)
+
+            if not expanded:
+                active.add(current)
+                stack.append((current, True))
+                stack.extend(
+                    (child, False)
+                    for child in children
+                    if child not in self._subtree_hashes and child not in active
+                )
+                continue
+
+            active.discard(current)
+            connections = sorted(
+                self.connection_hash(connection)
+                for connection in self._sources_table.get(current, {})
+            )
+            subtrees = sorted(
+                self._subtree_hashes.get(child, b"cycle" + hashing.encode(child))
+                for child in children
+            )
+            self._subtree_hashes[current] = hashing.digest(
+                self.node_hash(current), *connections, *subtrees
+            )
+
+        return self._subtree_hashes[id]
+
+    def root_hash(self) -> bytes:
+        return self.cached(
+            "root_hash",
+            lambda mgraph: hashing.digest(
+                *sorted(mgraph.subtree_hash(root) for root in mgraph.roots())
+            ),
+        )
+
+    def diff(self, other: "MGraph") -> hashing.Diff:
+        return hashing.diff(self, other)
+
+    def save_snapshot(self, path: str) -> None:
+        from solvent import storage
+
+        storage.save(self, path)
+
+    @classmethod
+    def open_snapshot(cls, path: str) -> "storage.MappedGraph":
+        from solvent import storage
+
+        return storage.MappedGraph(path)
+
+    def cached(
+        self, key: typing.Hashable, builder: typing.Callable[["MGraph"], typing.Any]
+    ) -> typing.Any:
+        if key not in self._cache:
+            self._cache[key] = builder(self)
+
+        return self._cache[key]
+
+    def node_index(self, id: uuid.UUID) -> typing.Optional[int]:
+        return self._node_index.get(id)
+
+    def node_id(self, index: int) -> typing.Optional[uuid.UUID]:
+        return self._node_ids[index]
+
+    def connection_index(self, id: uuid.UUID) -> typing.Optional[int]:
+        return self._connection_index.get(id)
+
+    def connection_id(self, index: int) -> typing.Optional[uuid.UUID]:
+        return self._connection_ids[index]
+
+    def adjacency(self) -> adjacency.Adjacency:
+        return self.cached("adjacency", adjacency.Adjacency.from_graph)
 
     def get_node(self, id: uuid.UUID) -> typing.Optional[Node]:
         return self._node_table.get(id)
@@ -105,9 +916,13 @@ class MGraph:
     def get_connections_from_source(
         self, id: uuid.UUID
     ) -> typing.Optional[list[Connection]]:
-        return self._sources_table.get(id)
+        connections = self._sources_table.get(id)
+
+        return list(connections.values()) if connections is not None else None
 
     def get_connections_from_destination(
         self, id: uuid.UUID
     ) -> typing.Optional[list[Connection]]:
-        return self._destinations_table.get(id)
+        connections = self._destinations_table.get(id)
+
+        return list(connections.values()) if connections is not None else None
@@ -0,0 +1,130 @@
+import hashlib
+import typing
+import uuid
+
+
+DIGEST_SIZE = 16
+
+
+def encode(value: typing.Any) -> bytes:
+    match value:
+        case None:
+            return b"n"
+        case bool():
+            return b"b1" if value else b"b0"
+        case int():
+            return b"i%d;" % value
+        case float():
+            return b"f" + repr(value).encode() + b";"
+        case str():
+            data = value.encode()
+            return b"s%d:" % len(data) + data
+        case bytes():
+            return b"y%d:" % len(value) + value
+        case uuid.UUID():
+            return b"u" + value.bytes
+        case list() | tuple():
+            return b"l%d:" % len(value) + b"".join(map(encode, value))
+        case set() | frozenset():
+            items = sorted(map(encode, value))
+            return b"e%d:" % len(items) + b"".join(items)
+        case dict():
+            items = sorted((encode(key), encode(item)) for key, item in value.items())
+            return b"d%d:" % len(items) + b"".join(key + item for key, item in items)
+        case _:
+            data = repr(value).encode()
+            return b"r%d:" % len(data) + data
+
+
+def digest(*parts: bytes) -> bytes:
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+    for part in parts:
+        hasher.update(part)
+
+    return hasher.digest()
+
+
+class Diff:
+    def __init__(self) -> None:
+        self.added_nodes = []
+        self.removed_nodes = []
+        self.changed_nodes = []
+        self.added_connections = []
+        self.removed_connections = []
+        self.changed_connections = []
+
+    def __bool__(self) -> bool:
+        return any(
+            (
+                self.added_nodes,
+                self.removed_nodes,
+                self.changed_nodes,
+                self.added_connections,
+                self.removed_connections,
+                self.changed_connections,
+            )
+        )
+
+
+def _compare(
+    old: dict[uuid.UUID, bytes],
+    new: dict[uuid.UUID, bytes],
+    added: list[uuid.UUID],
+    removed: list[uuid.UUID],
+    changed: list[uuid.UUID],
+) -> None:
+    for id, value in old.items():
+        if id not in new:
+            removed.append(id)
+        elif new[id] != value:
+            changed.append(id)
+
+    for id in new:
+        if id not in old:
+            added.append(id)
+
+
+def diff(old: typing.Any, new: typing.Any) -> Diff:
+    result = Diff()
+
+    if old.root_hash() == new.root_hash():
+        return result
+
+    nodes = ({}, {})
+    connections = ({}, {})
+    queue = list(dict.fromkeys(old.roots() + new.roots()))
+    visited = set(queue)
+
+    while queue:
+        id = queue.pop()
+        old_hash = old.subtree_hash(id) if old.contains(id) else None
+        new_hash = new.subtree_hash(id) if new.contains(id) else None
+
+        if old_hash == new_hash:
+            continue
+
+        for mgraph, node_hashes, connection_hashes in (
+            (old, nodes[0], connections[0]),
+            (new, nodes[1], connections[1]),
+        ):
+            if mgraph.get_node(id) is not None:
+                node_hashes[id] = mgraph.node_hash(id)
+
+            for connection in mgraph.get_connections_from_source(id) or []:
+                connection_hashes[connection.id] = mgraph.connection_hash(connection.id)
+
+            for child in mgraph.children(id):
+                if child not in visited:
+                    visited.add(child)
+                    queue.append(child)
+
+    _compare(*nodes, result.added_nodes, result.removed_nodes, result.changed_nodes)
+    _compare(
+        *connections,
+        result.added_connections,
+        result.removed_connections,
+        result.changed_connections,
+    )
+
+    return result
@@ -0,0 +1,157 @@
+import concurrent.futures
+import hashlib
+import os
+import threading
+import time
+import typing
+import uuid
+
+from solvent import graph, modeling, packed
+from solvent.mapping import (
+    batch,
+    cache,
+    compiler,
+    incremental,
+    instrumentation,
+    interpreter,
+    parser,
+    registry,
+)
+
+GRAMMAR = os.path.join(os.path.dirname(__file__), "mapping.tx")
+
+CLASSES = (
+    interpreter.Logic,
+    interpreter.Relational,
+    interpreter.Arithmetic,
+    interpreter.Variable,
+    interpreter.Range,
+    interpreter.Value,
+)
+
+PARSERS = ("textx", "fast")
+
+_metamodel = None
+_parser = "textx"
+_lock = threading.Lock()
+
+
+def _grammar_version() -> str:
+    with open(GRAMMAR, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=8).hexdigest()
+
+
+GRAMMAR_VERSION = _grammar_version()
+
+
+def get_metamodel() -> typing.Any:
+    global _metamodel
+
+    if _metamodel is None:
+        with _lock:
+            if _metamodel is None:
+                from textx import metamodel_from_file
+
+                _metamodel = metamodel_from_file(GRAMMAR, classes=list(CLASSES))
+
+    return _metamodel
+
+
+def preload() -> None:
+    get_metamodel()
+
+
+def _parse(code: str) -> interpreter.constraint:
+    if _parser == "fast":
+        return parser.parse(code)
+
+    return get_metamodel().model_from_str(code)
+
+
+def configure_parser(name: str = "textx") -> None:
+    global _parser
+
+    if name not in PARSERS:
+        raise ValueError()
+
+    _parser = name
+
+
+_parse_cache = cache.ParseCache(_parse, GRAMMAR_VERSION)
+
+
+def configure_cache(maxsize: int = 1024, path: typing.Optional[str] = None) -> None:
+    global _parse_cache
+
+    _parse_cache.close()
+    _parse_cache = cache.ParseCache(_parse, GRAMMAR_VERSION, maxsize, path)
+
+
+def parse(code: str) -> interpreter.constraint:
+    if not instrumentation.enabled():
+        return _parse_cache.parse(code)
+
+    start = time.perf_counter()
+
+    try:
+        return _parse_cache.parse(code)
+    finally:
+        instrumentation.record("parse", code, start, time.perf_counter())
+
+
+def cache_info() -> cache.CacheInfo:
+    return _parse_cache.info()
+
+
+def compile_rule(
+    code: str,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> compiler.rule:
+    return compiler.compile(parse(code), factory, simplify, check, code)
+
+
+def apply_rules(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    columnar: bool = False,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = 1024,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Union[list[typing.Any], dict[str, batch.Column]]:
+    return batch.apply_rules(
+        mgraph, rules, columnar, executor, chunk_size, factory, simplify, check
+    )
+
+
+def iter_constraints(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Iterator[tuple[uuid.UUID, typing.Any]]:
+    return batch.iter_constraints(mgraph, rules, factory, simplify, check)
+
+
+def iter_chunks(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    chunk_size: int = 1024,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Iterator[list[tuple[uuid.UUID, typing.Any]]]:
+    return batch.iter_chunks(mgraph, rules, chunk_size, factory, simplify, check)
+
+
+def pack_rules(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    simplify: bool = False,
+    check: bool = True,
+) -> packed.Packed:
+    return batch.pack_rules(mgraph, rules, simplify, check)
@@ -0,0 +1,209 @@
+import collections
+import concurrent.futures
+import itertools
+import typing
+import uuid
+
+from solvent import graph, modeling, packed
+
+
+Column = collections.namedtuple("Column", ["ids", "models"])
+
+KINDS = ("Node", "Connection")
+
+
+def _groups(mgraph: graph.MGraph) -> dict[str, list[graph.component]]:
+    groups = collections.defaultdict(list)
+
+    for kind, components in (
+        ("Node", mgraph.nodes),
+        ("Connection", mgraph.connections),
+    ):
+        groups[kind] = components
+
+        for component in components:
+            type = component.get("type")
+
+            if isinstance(type, str):
+                groups[f"{kind}:{type}"].append(component)
+
+    return groups
+
+
+def parse_selector(selector: str) -> tuple[str, typing.Optional[str]]:
+    kind, separator, type = selector.partition(":")
+
+    if kind not in KINDS or (separator and not type):
+        raise ValueError()
+
+    return kind, type or None
+
+
+def select(mgraph: graph.MGraph, selector: str) -> list[graph.component]:
+    parse_selector(selector)
+
+    return mgraph.cached(("mapping.groups",), _groups).get(selector, [])
+
+
+def iter_select(
+    mgraph: graph.MGraph, selector: str
+) -> typing.Iterator[graph.component]:
+    kind, type = parse_selector(selector)
+    components = mgraph.iter_nodes() if kind == "Node" else mgraph.iter_connections()
+
+    if type is None:
+        return components
+
+    return (component for component in components if component.get("type") == type)
+
+
+def _compile(
+    code: str,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Callable[[graph.component], typing.Any]:
+    from solvent import mapping
+
+    return mapping.compile_rule(code, factory, simplify, check)
+
+
+def _evaluate(
+    code: str,
+    components: list[graph.component],
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> list[typing.Any]:
+    return list(map(_compile(code, factory, simplify, check), components))
+
+
+def _chunks(
+    components: list[graph.component], chunk_size: int
+) -> typing.Iterator[list[graph.component]]:
+    for start in range(0, len(components), chunk_size):
+        yield components[start : start + chunk_size]
+
+
+def apply_rules(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    columnar: bool = False,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = 1024,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Union[list[typing.Any], dict[str, Column]]:
+    if chunk_size < 1:
+        raise ValueError()
+
+    groups = {selector: select(mgraph, selector) for selector in rules}
+    compiled = {
+        selector: _compile(code, factory, simplify, check)
+        for selector, code in rules.items()
+    }
+
+    if executor is None:
+        results = {
+            selector: list(map(rule, groups[selector]))
+            for selector, rule in compiled.items()
+        }
+    else:
+        futures = {
+            selector: [
+                executor.submit(_evaluate, code, chunk, None, simplify, check)
+                for chunk in _chunks(groups[selector], chunk_size)
+            ]
+            for selector, code in rules.items()
+        }
+        results = {
+            selector: [model for future in pending for model in future.result()]
+            for selector, pending in futures.items()
+        }
+
+        if factory is not None:
+            results = {
+                selector: list(map(factory.intern, models))
+                for selector, models in results.items()
+            }
+
+    if columnar:
+        return {
+            selector: Column(
+                [component.id for component in groups[selector]], results[selector]
+            )
+            for selector in rules
+        }
+
+    return [model for selector in rules for model in results[selector]]
+
+
+def _stream(
+    mgraph: graph.MGraph,
+    compiled: dict[str, typing.Callable[[graph.component], typing.Any]],
+) -> typing.Iterator[tuple[uuid.UUID, typing.Any]]:
+    for selector, rule in compiled.items():
+        for component in iter_select(mgraph, selector):
+            yield component.id, rule(component)
+
+
+def iter_constraints(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Iterator[tuple[uuid.UUID, typing.Any]]:
+    compiled = {
+        selector: _compile(code, factory, simplify, check)
+        for selector, code in rules.items()
+    }
+
+    for selector in compiled:
+        parse_selector(selector)
+
+    return _stream(mgraph, compiled)
+
+
+def _batched(
+    constraints: typing.Iterator[tuple[uuid.UUID, typing.Any]], chunk_size: int
+) -> typing.Iterator[list[tuple[uuid.UUID, typing.Any]]]:
+    while chunk := list(itertools.islice(constraints, chunk_size)):
+        yield chunk
+
+
+def iter_chunks(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    chunk_size: int = 1024,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+) -> typing.Iterator[list[tuple[uuid.UUID, typing.Any]]]:
+    if chunk_size < 1:
+        raise ValueError()
+
+    return _batched(
+        iter_constraints(mgraph, rules, factory, simplify, check), chunk_size
+    )
+
+
+def pack_rules(
+    mgraph: graph.MGraph,
+    rules: dict[str, str],
+    simplify: bool = False,
+    check: bool = True,
+) -> packed.Packed:
+    result = packed.Packed()
+    factory = None if simplify else result
+    compiled = {
+        selector: _compile(code, factory, simplify, check)
+        for selector, code in rules.items()
+    }
+
+    for selector, rule in compiled.items():
+        for component in iter_select(mgraph, selector):
+            result.add(rule(component), component.id)
+
+    return result
@@ -0,0 +1,98 @@
+import collections
+import re
+import shelve
+import threading
+import typing
+
+from solvent.mapping import interpreter
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "disk_hits", "maxsize", "currsize"]
+)
+
+
+def normalize(code: str) -> str:
+    return re.sub(r"\s*([(),.])\s*", r"\1", " ".join(code.split()))
+
+
+class ParseCache:
+    def __init__(
+        self,
+        parser: typing.Callable[[str], interpreter.constraint],
+        version: str,
+        maxsize: int = 1024,
+        path: typing.Optional[str] = None,
+    ) -> None:
+        self.parser = parser
+        self.version = version
+        self.maxsize = maxsize
+        self.path = path
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._store = None
+
+    def _disk(self) -> typing.Optional[shelve.Shelf]:
+        if self.path is not None and self._store is None:
+            self._store = shelve.open(self.path)
+
+        return self._store
+
+    def parse(self, code: str) -> interpreter.constraint:
+        key = f"{self.version}:{normalize(code)}"
+
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+                return self._entries[key]
+
+            store = self._disk()
+
+            if store is not None and key in store:
+                self.disk_hits += 1
+                constraint = interpreter.load(store[key])
+            else:
+                self.misses += 1
+                constraint = None
+
+        if constraint is None:
+            data = interpreter.dump(self.parser(code))
+            constraint = interpreter.load(data)
+
+            with self._lock:
+                store = self._disk()
+
+                if store is not None:
+                    store[key] = data
+
+        with self._lock:
+            self._entries[key] = constraint
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return constraint
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.disk_hits, self.maxsize, len(self._entries)
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
@@ -0,0 +1,150 @@
+import typing
+
+from solvent.mapping import interpreter
+
+
+BOOL = "bool"
+INT = "int"
+RANGE = "range"
+INCLUSIVENESS = "inclusiveness"
+VARIABLE = "variable"
+
+INCLUSIVENESSES = ("Inclusive", "Exclusive")
+
+SIGNATURES = {
+    (interpreter.Logic, "Equivalence"): ({BOOL}, 2, None, BOOL),
+    (interpreter.Logic, "Implication"): ({BOOL}, 2, 2, BOOL),
+    (interpreter.Logic, "Negation"): ({BOOL}, 1, 1, BOOL),
+    (interpreter.Logic, "And"): ({BOOL}, 1, None, BOOL),
+    (interpreter.Logic, "Or"): ({BOOL}, 1, None, BOOL),
+    (interpreter.Logic, "Xor"): ({BOOL}, 1, None, BOOL),
+    (interpreter.Relational, "Inferior"): ({INT}, 2, 2, BOOL),
+    (interpreter.Relational, "Superior"): ({INT}, 2, 2, BOOL),
+    (interpreter.Relational, "Equal"): ({INT}, 2, None, BOOL),
+    (interpreter.Relational, "Different"): ({INT}, 2, None, BOOL),
+    (interpreter.Arithmetic, "Addition"): ({INT}, 1, None, INT),
+    (interpreter.Arithmetic, "Subtraction"): ({INT}, 2, None, INT),
+    (interpreter.Arithmetic, "Multiplication"): ({INT}, 1, None, INT),
+    (interpreter.Arithmetic, "Division"): ({INT}, 2, None, INT),
+    (interpreter.Arithmetic, "Minimum"): ({INT}, 1, None, INT),
+    (interpreter.Arithmetic, "Maximum"): ({INT}, 1, None, INT),
+    (interpreter.Variable, "Integer"): ({INT, RANGE}, 1, None, VARIABLE),
+    (interpreter.Variable, "Boolean"): ({BOOL}, 1, None, VARIABLE),
+}
+
+ORDERED = ("Inferior", "Superior")
+
+path = tuple[str, tuple[str, ...]]
+
+
+def _literal(parameter: typing.Any) -> str:
+    match parameter:
+        case bool():
+            return BOOL
+        case int():
+            return INT
+        case str() if parameter in INCLUSIVENESSES:
+            return INCLUSIVENESS
+        case interpreter.Range() if parameter.minimum <= parameter.maximum:
+            return RANGE
+        case _:
+            raise TypeError()
+
+
+def _accepts(accepted: set[str], kind: str, parameter: typing.Any) -> bool:
+    return kind in accepted or (
+        BOOL in accepted and kind == INT and parameter in (0, 1)
+    )
+
+
+def _infer(constraint: typing.Any, expectations: dict[path, str]) -> str:
+    signature = SIGNATURES.get((type(constraint), getattr(constraint, "type", None)))
+
+    if signature is None:
+        raise ValueError()
+
+    accepted, minimum, maximum, result = signature
+    parameters = list(constraint.parameters)
+
+    if (
+        constraint.type in ORDERED
+        and parameters
+        and isinstance(parameters[-1], str)
+        and parameters[-1] in INCLUSIVENESSES
+    ):
+        parameters.pop()
+
+    fixed = 0
+
+    for parameter in parameters:
+        if isinstance(parameter, interpreter.Value):
+            key = (parameter.type, tuple(parameter.values))
+
+            if result == VARIABLE:
+                expectations.setdefault(key, VARIABLE)
+                continue
+
+            expected = BOOL if BOOL in accepted else INT
+
+            if expectations.get(key, VARIABLE) not in (VARIABLE, expected):
+                raise TypeError()
+
+            expectations[key] = expected
+
+            continue
+
+        fixed += 1
+
+        if isinstance(parameter, tuple(interpreter.OPERATORS.values())):
+            kind = _infer(parameter, expectations)
+        else:
+            kind = _literal(parameter)
+
+        if not _accepts(accepted, kind, parameter):
+            raise TypeError()
+
+    if fixed == len(parameters) and fixed < minimum:
+        raise TypeError()
+
+    if maximum is not None and fixed > maximum:
+        raise TypeError()
+
+    return result
+
+
+def check(constraint: interpreter.constraint) -> dict[path, str]:
+    expectations = {}
+    _infer(constraint, expectations)
+
+    if len({type for type, values in expectations}) > 1:
+        raise TypeError()
+
+    return expectations
+
+
+def _conforms(expected: str, data: typing.Any) -> bool:
+    match data:
+        case None:
+            return False
+        case bool():
+            return expected == BOOL
+        case int():
+            return expected == INT
+        case _:
+            return True
+
+
+def verify(expected: str) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+    if expected == VARIABLE:
+        return None
+
+    def guard(data: typing.Any) -> typing.Any:
+        if isinstance(data, list):
+            if not all(_conforms(expected, item) for item in data):
+                raise TypeError()
+        elif not _conforms(expected, data):
+            raise TypeError()
+
+        return data
+
+    return guard
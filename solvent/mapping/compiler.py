@@ -0,0 +1,270 @@
+import collections
+import functools
+import time
+import typing
+
+from solvent import graph, modeling
+from solvent.mapping import checker, instrumentation, interpreter
+
+
+rule = typing.Callable[[graph.component], typing.Any]
+
+CONSTRUCTORS = {
+    interpreter.Logic: {
+        "Equivalence": modeling.Equivalence,
+        "Implication": modeling.Implication,
+        "Negation": modeling.Negation,
+        "And": modeling.And,
+        "Or": modeling.Or,
+        "Xor": modeling.Xor,
+    },
+    interpreter.Relational: {
+        "Inferior": modeling.Inferior,
+        "Superior": modeling.Superior,
+        "Equal": modeling.Equal,
+        "Different": modeling.Different,
+    },
+    interpreter.Arithmetic: {
+        "Addition": modeling.Addition,
+        "Subtraction": modeling.Subtraction,
+        "Multiplication": modeling.Multiplication,
+        "Division": modeling.Division,
+        "Minimum": modeling.Minimum,
+        "Maximum": modeling.Maximum,
+    },
+    interpreter.Variable: {
+        "Integer": modeling.Integer,
+        "Boolean": modeling.Boolean,
+    },
+}
+
+
+step = typing.Callable[[graph.component, typing.Optional[dict]], typing.Any]
+
+
+class Context:
+    def __init__(
+        self,
+        repeated: set[checker.path],
+        factory: typing.Optional[modeling.Factory] = None,
+        expectations: typing.Optional[dict[checker.path, str]] = None,
+        name: typing.Optional[str] = None,
+    ) -> None:
+        self.repeated = repeated
+        self.factory = factory
+        self.expectations = expectations or {}
+        self.name = name
+
+
+def _literal(parameter: typing.Any) -> bool:
+    return isinstance(parameter, (bool, int, str))
+
+
+def paths(constraint: typing.Any) -> typing.Iterator[tuple[str, tuple[str, ...]]]:
+    match constraint:
+        case interpreter.Value():
+            yield constraint.type, tuple(constraint.values)
+        case (
+            interpreter.Logic()
+            | interpreter.Relational()
+            | interpreter.Arithmetic()
+            | interpreter.Variable()
+        ):
+            for parameter in constraint.parameters:
+                yield from paths(parameter)
+
+
+def _value(constraint: interpreter.Value, context: Context) -> step:
+    key = (constraint.type, tuple(constraint.values))
+    access = interpreter.accessor(*key)
+
+    guard = checker.verify(context.expectations.get(key, checker.VARIABLE))
+
+    if guard is not None:
+        access = _guarded(access, guard)
+
+    if context.name is not None:
+        access = instrumentation.timed(access, "resolve", context.name)
+
+    if key not in context.repeated:
+        return lambda component, memo: access(component)
+
+    def memoized(component: graph.component, memo: dict) -> typing.Any:
+        if key not in memo:
+            memo[key] = access(component)
+
+        return memo[key]
+
+    return memoized
+
+
+def _guarded(
+    access: typing.Callable[[graph.component], typing.Any],
+    guard: typing.Callable[[typing.Any], typing.Any],
+) -> typing.Callable[[graph.component], typing.Any]:
+    return lambda component: guard(access(component))
+
+
+def _operator(constraint: interpreter.constraint, context: Context) -> step:
+    factory = context.factory
+    cls = CONSTRUCTORS[type(constraint)].get(constraint.type)
+
+    if cls is None:
+        raise ValueError()
+
+    constructor = cls if factory is None else functools.partial(factory.make, cls)
+
+    parameters = constraint.parameters
+
+    if all(map(_literal, parameters)):
+        literals = tuple(parameters)
+
+        if factory is not None:
+            model = constructor(*literals)
+
+            return lambda component, memo: model
+
+        return lambda component, memo: constructor(*literals)
+
+    if not any(isinstance(parameter, interpreter.Value) for parameter in parameters):
+        steps = tuple(
+            (
+                (lambda component, memo, literal=parameter: literal)
+                if _literal(parameter)
+                else _compile(parameter, context)
+            )
+            for parameter in parameters
+        )
+
+        return lambda component, memo: constructor(
+            *[step(component, memo) for step in steps]
+        )
+
+    steps = tuple(
+        (
+            (parameter, None)
+            if _literal(parameter)
+            else (None, _compile(parameter, context))
+        )
+        for parameter in parameters
+    )
+
+    def evaluate(component: graph.component, memo: typing.Optional[dict]) -> typing.Any:
+        data = []
+
+        for literal, step in steps:
+            if step is None:
+                data.append(literal)
+                continue
+
+            result = step(component, memo)
+
+            if isinstance(result, list):
+                data.extend(result)
+            else:
+                data.append(result)
+
+        return constructor(*data)
+
+    return evaluate
+
+
+def _compile(constraint: interpreter.constraint, context: Context) -> step:
+    match constraint:
+        case interpreter.Range():
+            minimum, maximum = constraint.minimum, constraint.maximum
+
+            if context.factory is not None:
+                model = context.factory.make(modeling.Range, minimum, maximum)
+
+                return lambda component, memo: model
+
+            return lambda component, memo: modeling.Range(minimum, maximum)
+        case interpreter.Value():
+            return _value(constraint, context)
+        case (
+            interpreter.Logic()
+            | interpreter.Relational()
+            | interpreter.Arithmetic()
+            | interpreter.Variable()
+        ):
+            return _operator(constraint, context)
+        case _:
+            raise ValueError()
+
+
+def _build(
+    constraint: interpreter.constraint,
+    factory: typing.Optional[modeling.Factory],
+    simplify: bool,
+    check: bool,
+    name: typing.Optional[str],
+) -> rule:
+    if not check:
+        expectations = None
+    elif name is not None:
+        expectations = instrumentation.timed(checker.check, "check", name)(constraint)
+    else:
+        expectations = checker.check(constraint)
+
+    counts = collections.Counter(paths(constraint))
+    repeated = {key for key, count in counts.items() if count > 1}
+    evaluate = _compile(constraint, Context(repeated, factory, expectations, name))
+
+    if simplify:
+        return lambda component: modeling.simplify(
+            evaluate(component, {} if repeated else None), factory
+        )
+
+    if repeated:
+        return lambda component: evaluate(component, {})
+
+    return lambda component: evaluate(component, None)
+
+
+def _instrument(
+    constraint: interpreter.constraint,
+    factory: typing.Optional[modeling.Factory],
+    simplify: bool,
+    check: bool,
+    name: typing.Optional[str],
+) -> rule:
+    if name is None:
+        name = repr(interpreter.dump(constraint))
+
+    start = time.perf_counter()
+    compiled = _build(constraint, factory, simplify, check, name)
+    instrumentation.record("compile", name, start, time.perf_counter())
+
+    return instrumentation.timed(compiled, "evaluate", name)
+
+
+def compile(
+    constraint: interpreter.constraint,
+    factory: typing.Optional[modeling.Factory] = None,
+    simplify: bool = False,
+    check: bool = True,
+    name: typing.Optional[str] = None,
+) -> rule:
+    plain = instrumented = None
+
+    if instrumentation.enabled():
+        instrumented = _instrument(constraint, factory, simplify, check, name)
+    else:
+        plain = _build(constraint, factory, simplify, check, None)
+
+    def compiled(component: graph.component) -> typing.Any:
+        nonlocal plain, instrumented
+
+        if instrumentation.enabled():
+            if instrumented is None:
+                instrumented = _instrument(constraint, factory, simplify, check, name)
+
+            return instrumented(component)
+
+        if plain is None:
+            plain = _build(constraint, factory, simplify, check, None)
+
+        return plain(component)
+
+    return compiled
@@ -0,0 +1,177 @@
+import collections
+import typing
+import uuid
+
+from solvent import graph
+from solvent.mapping import checker, registry
+
+
+read = tuple[uuid.UUID, str]
+
+
+class Delta:
+    def __init__(self) -> None:
+        self.added = []
+        self.removed = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def reads(path: checker.path, component: graph.component) -> set[read]:
+    result = set()
+    items = [component]
+
+    for value in path[1]:
+        following = []
+
+        for item in items:
+            match item:
+                case graph.Node() | graph.Connection():
+                    result.add((item.id, value))
+                    data = item.get(value)
+                case dict():
+                    data = item.get(value)
+                case _:
+                    continue
+
+            if isinstance(data, list):
+                following.extend(data)
+            else:
+                following.append(data)
+
+        items = following
+
+    return result
+
+
+def _changes(old: graph.component, new: graph.component) -> set[str]:
+    old, new = old.parameters, new.parameters
+
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def _difference(
+    old: list[typing.Any], new: list[typing.Any]
+) -> tuple[list[typing.Any], list[typing.Any]]:
+    removed = list(old)
+    added = []
+
+    for model in new:
+        for index, previous in enumerate(removed):
+            if previous is model or previous == model:
+                del removed[index]
+                break
+        else:
+            added.append(model)
+
+    return added, removed
+
+
+class Mapper:
+    def __init__(self, mgraph: graph.MGraph, rules: registry.Registry) -> None:
+        self.graph = mgraph
+        self.registry = rules
+
+        self._models = {}
+        self._reads = {}
+        self._readers = collections.defaultdict(dict)
+        self._listeners = []
+
+        for components in (mgraph.iter_nodes(), mgraph.iter_connections()):
+            for component in components:
+                self._store(component)
+
+        mgraph.subscribe(self._on_change)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._models.values()))
+
+    def close(self) -> None:
+        self.graph.unsubscribe(self._on_change)
+
+    def subscribe(self, listener: typing.Callable[[Delta], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: typing.Callable[[Delta], None]) -> None:
+        self._listeners.remove(listener)
+
+    def constraints(self) -> typing.Iterator[tuple[uuid.UUID, typing.Any]]:
+        for id, models in self._models.items():
+            for model in models:
+                yield id, model
+
+    def readers(self, id: uuid.UUID, name: str) -> set[uuid.UUID]:
+        return set(self._readers.get((id, name), ()))
+
+    def _map(self, component: graph.component) -> tuple[list[typing.Any], set[read]]:
+        models = []
+        dependencies = {(component.id, "type")}
+
+        for compiled in self.registry.dispatch(component):
+            models.append(compiled(component))
+
+            for path in self.registry.dependencies(compiled):
+                dependencies |= reads(path, component)
+
+        return models, dependencies
+
+    def _store(self, component: graph.component) -> list[typing.Any]:
+        models, dependencies = self._map(component)
+
+        self._models[component.id] = models
+        self._reads[component.id] = dependencies
+
+        for dependency in dependencies:
+            self._readers[dependency][component.id] = None
+
+        return models
+
+    def _forget(self, id: uuid.UUID) -> list[typing.Any]:
+        for dependency in self._reads.pop(id, ()):
+            owners = self._readers[dependency]
+            owners.pop(id, None)
+
+            if not owners:
+                del self._readers[dependency]
+
+        return self._models.pop(id, [])
+
+    def _remap(self, id: uuid.UUID, delta: Delta) -> None:
+        old = self._forget(id)
+        component = self.graph.get_node(id)
+
+        if component is None:
+            component = self.graph.get_connection(id)
+
+        new = self._store(component) if component is not None else []
+
+        added, removed = _difference(old, new)
+        delta.added.extend((id, model) for model in added)
+        delta.removed.extend((id, model) for model in removed)
+
+    def _on_change(
+        self,
+        event: str,
+        old: typing.Optional[graph.component],
+        new: typing.Optional[graph.component],
+    ) -> None:
+        if old is not None and new is not None:
+            names = _changes(old, new)
+        else:
+            names = (old or new).parameters.keys()
+
+        id = (old or new).id
+        affected = {id: None}
+
+        for name in names:
+            affected.update(self._readers.get((id, name), {}))
+
+        delta = Delta()
+
+        for owner in affected:
+            self._remap(owner, delta)
+
+        if delta:
+            for listener in list(self._listeners):
+                listener(delta)
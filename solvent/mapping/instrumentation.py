@@ -0,0 +1,97 @@
+import bisect
+import threading
+import time
+import typing
+
+
+BOUNDARIES = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+STAGES = ("parse", "check", "compile", "evaluate", "resolve")
+
+hook = typing.Callable[[str, str, float, float], None]
+
+_enabled = False
+_statistics = {}
+_hooks = []
+_lock = threading.Lock()
+
+
+class Histogram:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.buckets = [0] * (len(BOUNDARIES) + 1)
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.minimum = duration if self.minimum is None else min(self.minimum, duration)
+        self.maximum = duration if self.maximum is None else max(self.maximum, duration)
+        self.buckets[bisect.bisect_left(BOUNDARIES, duration)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+def enable() -> None:
+    global _enabled
+
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+
+    _enabled = False
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    with _lock:
+        _statistics.clear()
+
+
+def statistics() -> dict[tuple[str, str], Histogram]:
+    with _lock:
+        return dict(_statistics)
+
+
+def add_hook(function: hook) -> None:
+    _hooks.append(function)
+
+
+def remove_hook(function: hook) -> None:
+    _hooks.remove(function)
+
+
+def record(stage: str, rule: str, start: float, end: float) -> None:
+    with _lock:
+        histogram = _statistics.get((stage, rule))
+
+        if histogram is None:
+            histogram = _statistics[(stage, rule)] = Histogram()
+
+        histogram.record(end - start)
+
+    for function in list(_hooks):
+        function(stage, rule, start, end)
+
+
+def timed(
+    function: typing.Callable[..., typing.Any], stage: str, rule: str
+) -> typing.Callable[..., typing.Any]:
+    def wrapper(*args: typing.Any) -> typing.Any:
+        start = time.perf_counter()
+
+        try:
+            return function(*args)
+        finally:
+            record(stage, rule, start, time.perf_counter())
+
+    return wrapper
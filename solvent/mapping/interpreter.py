@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from solvent import modeling, graph
@@ -130,6 +131,83 @@ class Range:
         return modeling.Range(*[self.minimum, self.maximum])
 
 
+STRUCTURE = {
+    ("Connection", "source"): "Node",
+    ("Connection", "destination"): "Node",
+    ("Connection", "destinations"): "Nodes",
+}
+
+
+def _hop(name: str) -> typing.Callable[[typing.Any], typing.Any]:
+    def hop(data: typing.Any) -> typing.Any:
+        match data:
+            case graph.Node() | graph.Connection():
+                return data.get(name)
+            case dict():
+                return data.get(name)
+            case list():
+                result = []
+
+                for item in data:
+                    if isinstance(item, list):
+                        result.extend(hop(item))
+                    elif isinstance(item, (graph.Node, graph.Connection, dict)):
+                        result.append(hop(item))
+
+                return result
+            case _:
+                raise ValueError()
+
+    return hop
+
+
+def _step(
+    kind: typing.Optional[str], name: str
+) -> typing.Callable[[typing.Any], typing.Any]:
+    match kind:
+        case "Node" | "Connection":
+            return lambda data: data.get(name)
+        case "Nodes":
+            return lambda data: [item.get(name) for item in data]
+        case _:
+            return _hop(name)
+
+
+@functools.lru_cache(maxsize=None)
+def accessor(
+    type: str, values: tuple[str, ...]
+) -> typing.Callable[[graph.component], typing.Any]:
+    match type:
+        case "Node":
+            expected = graph.Node
+        case "Connection":
+            expected = graph.Connection
+        case _:
+            raise ValueError()
+
+    kind = type
+    steps = []
+
+    for value in values:
+        steps.append(_step(kind, value))
+        kind = STRUCTURE.get((kind, value))
+
+    steps = tuple(steps)
+
+    def access(component: graph.component) -> typing.Any:
+        if not isinstance(component, expected):
+            raise TypeError()
+
+        data = component
+
+        for step in steps:
+            data = step(data)
+
+        return data
+
+    return access
+
+
 class Value:
     def __init__(self, type: str, values: list[str], parent: typing.Any) -> None:
         self.type = type
@@ -137,29 +215,47 @@ class Value:
         self.parent = parent
 
     def to_model(self, component: graph.component) -> typing.Any:
-        if self.type == "Node" and not isinstance(component, graph.Node):
-            raise TypeError()
+        return accessor(self.type, tuple(self.values))(component)
 
-        if self.type == "Connection" and not isinstance(component, graph.Connection):
-            raise TypeError()
 
-        data = component
+constraint = typing.Union[Logic, Relational, Arithmetic, Variable, Range, Value]
+
+OPERATORS = {
+    "Logic": Logic,
+    "Relational": Relational,
+    "Arithmetic": Arithmetic,
+    "Variable": Variable,
+}
 
-        for value in self.values:
-            match data:
-                case graph.Node() | graph.Connection():
-                    data = data.parameters.get(value)
-                case dict():
-                    data = data.get(value)
-                case list():
-                    aux = []
-                    for item in data:
-                        if type(item) in (graph.Node, graph.Connection):
-                            aux.append(item.parameters.get(value))
-                        elif isinstance(item, dict):
-                            aux.append(item.get(value))
-                    data = data
-                case None:
-                    raise ValueError
 
+def dump(parameter: typing.Any) -> typing.Any:
+    match parameter:
+        case Range():
+            return ("Range", parameter.minimum, parameter.maximum)
+        case Value():
+            return ("Value", parameter.type, tuple(parameter.values))
+        case Logic() | Relational() | Arithmetic() | Variable():
+            return (
+                type(parameter).__name__,
+                parameter.type,
+                tuple(map(dump, parameter.parameters)),
+            )
+        case _:
+            return parameter
+
+
+def load(data: typing.Any, parent: typing.Any = None) -> typing.Any:
+    if not isinstance(data, tuple):
         return data
+
+    match data[0]:
+        case "Range":
+            return Range(data[1], data[2], parent)
+        case "Value":
+            return Value(data[1], list(data[2]), parent)
+        case _:
+            operator = OPERATORS[data[0]](data[1], [])
+            operator.parent = parent
+            operator.parameters = [load(item, operator) for item in data[2]]
+
+            return operator
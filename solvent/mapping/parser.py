@@ -0,0 +1,202 @@
+import re
+import typing
+
+from solvent.mapping import interpreter
+
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+ID = re.compile(r"[^\d\W]\w*\b")
+BOOL = re.compile(r"(True|true|False|false|0|1)\b")
+INT = re.compile(r"[-+]?[0-9]+")
+
+TYPES = {
+    interpreter.Logic: ("Equivalence", "Implication", "Negation", "And", "Or", "Xor"),
+    interpreter.Relational: ("Inferior", "Superior", "Equal", "Different"),
+    interpreter.Arithmetic: (
+        "Addition",
+        "Subtraction",
+        "Multiplication",
+        "Division",
+        "Minimum",
+        "Maximum",
+    ),
+    interpreter.Variable: ("Integer", "Boolean"),
+}
+
+PARAMETERS = {
+    interpreter.Logic: ("BOOL", "Value", interpreter.Logic, interpreter.Relational),
+    interpreter.Relational: ("INT", "Value", "Inclusiveness", interpreter.Arithmetic),
+    interpreter.Arithmetic: ("INT", "Value", interpreter.Arithmetic),
+    interpreter.Variable: ("INT", "BOOL", "Value", "Range"),
+}
+
+CONSTRAINTS = (
+    interpreter.Logic,
+    interpreter.Relational,
+    interpreter.Arithmetic,
+    interpreter.Variable,
+)
+
+INCLUSIVENESS = ("Inclusive", "Exclusive")
+ENTITIES = ("Node", "Connection")
+
+NOT_FOUND = object()
+
+
+class Parser:
+    def __init__(self, code: str) -> None:
+        self.code = code
+        self.position = 0
+
+    def _skip(self) -> None:
+        self.position = WHITESPACE.match(self.code, self.position).end()
+
+    def _literal(self, text: str) -> bool:
+        self._skip()
+
+        if self.code.startswith(text, self.position):
+            self.position += len(text)
+            return True
+
+        return False
+
+    def _choice(self, texts: tuple[str, ...]) -> typing.Optional[str]:
+        for text in texts:
+            if self._literal(text):
+                return text
+
+        return None
+
+    def _regex(self, pattern: re.Pattern) -> typing.Optional[str]:
+        self._skip()
+        match = pattern.match(self.code, self.position)
+
+        if match is None:
+            return None
+
+        self.position = match.end()
+
+        return match.group()
+
+    def _expect(self, text: str) -> None:
+        if not self._literal(text):
+            raise ValueError()
+
+    def parse(self) -> interpreter.constraint:
+        constraint = self._operator(CONSTRAINTS, None)
+        self._skip()
+
+        if constraint is None or self.position != len(self.code):
+            raise ValueError()
+
+        return constraint
+
+    def _operator(
+        self, classes: tuple[type, ...], parent: typing.Any
+    ) -> typing.Optional[interpreter.constraint]:
+        for cls in classes:
+            type = self._choice(TYPES[cls])
+
+            if type is None:
+                continue
+
+            operator = cls(type, [])
+            operator.parent = parent
+
+            self._expect("(")
+            operator.parameters.append(self._parameter(PARAMETERS[cls], operator))
+
+            while self._literal(","):
+                operator.parameters.append(self._parameter(PARAMETERS[cls], operator))
+
+            self._expect(")")
+
+            return operator
+
+        return None
+
+    def _parameter(
+        self, alternatives: tuple[typing.Any, ...], parent: typing.Any
+    ) -> typing.Any:
+        for alternative in alternatives:
+            match alternative:
+                case "BOOL":
+                    result = self._regex(BOOL)
+                    result = (
+                        NOT_FOUND if result is None else result in ("True", "true", "1")
+                    )
+                case "INT":
+                    result = self._regex(INT)
+                    result = NOT_FOUND if result is None else int(result)
+                case "Inclusiveness":
+                    result = self._choice(INCLUSIVENESS)
+                    result = NOT_FOUND if result is None else result
+                case "Value":
+                    result = self._value(parent)
+                case "Range":
+                    result = self._range(parent)
+                case _:
+                    result = self._operator((alternative,), parent)
+                    result = NOT_FOUND if result is None else result
+
+            if result is not NOT_FOUND:
+                return result
+
+        raise ValueError()
+
+    def _value(self, parent: typing.Any) -> typing.Any:
+        type = self._choice(ENTITIES)
+
+        if type is None:
+            return NOT_FOUND
+
+        self._expect(".")
+        values = [self._identifier()]
+
+        while True:
+            position = self.position
+
+            if not self._literal("."):
+                break
+
+            value = self._regex(ID)
+
+            if value is None:
+                self.position = position
+                break
+
+            values.append(value)
+
+        return interpreter.Value(type, values, parent)
+
+    def _identifier(self) -> str:
+        value = self._regex(ID)
+
+        if value is None:
+            raise ValueError()
+
+        return value
+
+    def _range(self, parent: typing.Any) -> typing.Any:
+        if not self._literal("Range"):
+            return NOT_FOUND
+
+        self._expect("(")
+        minimum = self._integer()
+        self._expect(",")
+        maximum = self._integer()
+        self._expect(")")
+
+        return interpreter.Range(minimum, maximum, parent)
+
+    def _integer(self) -> int:
+        value = self._regex(INT)
+
+        if value is None:
+            raise ValueError()
+
+        return int(value)
+
+
+def parse(code: str) -> interpreter.constraint:
+    return Parser(code).parse()
@@ -0,0 +1,102 @@
+import typing
+import uuid
+
+from solvent import graph, modeling
+from solvent.mapping import batch, checker, compiler
+
+
+rule = typing.Callable[[graph.component], typing.Any]
+
+
+class Registry:
+    def __init__(
+        self,
+        factory: typing.Optional[modeling.Factory] = None,
+        simplify: bool = False,
+        check: bool = True,
+    ) -> None:
+        self.factory = factory
+        self.simplify = simplify
+        self.check = check
+
+        self._rules = []
+        self._paths = {}
+        self._generic = {kind: () for kind in batch.KINDS}
+        self._dispatch = {}
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, selector: str) -> bool:
+        return any(entry[0] == selector for entry in self._rules)
+
+    def _rebuild(self) -> None:
+        generic = {kind: [] for kind in batch.KINDS}
+        dispatch = {}
+
+        for selector, kind, type, code, compiled in self._rules:
+            if type is not None:
+                dispatch.setdefault((kind, type), [])
+
+        for selector, kind, type, code, compiled in self._rules:
+            if type is None:
+                generic[kind].append(compiled)
+
+                for key, rules in dispatch.items():
+                    if key[0] == kind:
+                        rules.append(compiled)
+            else:
+                dispatch[(kind, type)].append(compiled)
+
+        self._generic = {kind: tuple(rules) for kind, rules in generic.items()}
+        self._dispatch = {key: tuple(rules) for key, rules in dispatch.items()}
+
+    def register(self, selector: str, code: str) -> rule:
+        from solvent import mapping
+
+        kind, type = batch.parse_selector(selector)
+        compiled = mapping.compile_rule(code, self.factory, self.simplify, self.check)
+
+        self._paths[compiled] = frozenset(compiler.paths(mapping.parse(code)))
+        self._rules.append((selector, kind, type, code, compiled))
+        self._rebuild()
+
+        return compiled
+
+    def unregister(self, selector: str) -> None:
+        if selector not in self:
+            raise KeyError(selector)
+
+        for entry in self._rules:
+            if entry[0] == selector:
+                del self._paths[entry[4]]
+
+        self._rules = [entry for entry in self._rules if entry[0] != selector]
+        self._rebuild()
+
+    def rules(self) -> dict[str, list[str]]:
+        rules = {}
+
+        for selector, kind, type, code, compiled in self._rules:
+            rules.setdefault(selector, []).append(code)
+
+        return rules
+
+    def dependencies(self, compiled: rule) -> frozenset[checker.path]:
+        return self._paths[compiled]
+
+    def dispatch(self, component: graph.component) -> tuple[rule, ...]:
+        kind = "Connection" if isinstance(component, graph.Connection) else "Node"
+
+        return self._dispatch.get((kind, component.get("type")), self._generic[kind])
+
+    def apply(self, component: graph.component) -> list[typing.Any]:
+        return [compiled(component) for compiled in self.dispatch(component)]
+
+    def iter_constraints(
+        self, mgraph: graph.MGraph
+    ) -> typing.Iterator[tuple[uuid.UUID, typing.Any]]:
+        for components in (mgraph.iter_nodes(), mgraph.iter_connections()):
+            for component in components:
+                for compiled in self.dispatch(component):
+                    yield component.id, compiled(component)
@@ -1,22 +1,90 @@
+import functools
+import operator
 import typing
+import weakref
+
+
+def _typed(parameter: typing.Any) -> typing.Any:
+    if isinstance(parameter, Model):
+        return parameter
+
+    return type(parameter), parameter
+
+
+def _order(parameter: typing.Any) -> tuple[typing.Any, ...]:
+    match parameter:
+        case Model():
+            return parameter.order()
+        case bool():
+            return 0, int(parameter)
+        case int():
+            return 1, parameter
+        case str():
+            return 2, parameter
+        case _:
+            return 3, type(parameter).__name__, repr(parameter)
+
+
+class Model:
+    commutative = False
+
+    def __init__(self, *args: typing.Any) -> None:
+        self.parameters = self.canonical(args)
+        self._hash = None
+        self._order = None
+
+    @classmethod
+    def canonical(cls, args: tuple[typing.Any, ...]) -> tuple[typing.Any, ...]:
+        if cls.commutative:
+            return tuple(sorted(args, key=_order))
+
+        return tuple(args)
+
+    def __reduce__(self) -> tuple[typing.Callable, tuple[typing.Any, ...]]:
+        return type(self), self.parameters
+
+    def order(self) -> tuple[typing.Any, ...]:
+        if self._order is None:
+            self._order = (4, type(self).__name__, tuple(map(_order, self.parameters)))
+
+        return self._order
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((type(self), tuple(map(_typed, self.parameters))))
+
+        return self._hash
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
+
+        if type(self) is not type(other):
+            return NotImplemented
+
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+
+        return list(map(_typed, self.parameters)) == list(map(_typed, other.parameters))
 
 
 variable = typing.Union["Integer", "Boolean"]
 
 
-class Range:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Range(Model):
+    pass
 
 
-class Integer:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Integer(Model):
+    pass
 
 
-class Boolean:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Boolean(Model):
+    pass
 
 
 arithmetic = typing.Union[
@@ -24,34 +92,28 @@ arithmetic = typing.Union[
 ]
 
 
-class Addition:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Addition(Model):
+    commutative = True
 
 
-class Subtraction:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Subtraction(Model):
+    pass
 
 
-class Multiplication:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Multiplication(Model):
+    commutative = True
 
 
-class Division:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Division(Model):
+    pass
 
 
-class Minimum:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Minimum(Model):
+    commutative = True
 
 
-class Maximum:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Maximum(Model):
+    commutative = True
 
 
 relational = typing.Union[
@@ -62,24 +124,20 @@ relational = typing.Union[
 ]
 
 
-class Inferior:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Inferior(Model):
+    pass
 
 
-class Superior:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Superior(Model):
+    pass
 
 
-class Equal:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Equal(Model):
+    commutative = True
 
 
-class Different:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Different(Model):
+    commutative = True
 
 
 logic = typing.Union[
@@ -92,31 +150,252 @@ logic = typing.Union[
 ]
 
 
-class Equivalence:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+class Equivalence(Model):
+    commutative = True
+
+
+class Implication(Model):
+    pass
+
+
+class Negation(Model):
+    pass
+
+
+class And(Model):
+    commutative = True
+
+
+class Or(Model):
+    commutative = True
+
+
+class Xor(Model):
+    commutative = True
+
+
+MODELS = (
+    Range,
+    Integer,
+    Boolean,
+    Addition,
+    Subtraction,
+    Multiplication,
+    Division,
+    Minimum,
+    Maximum,
+    Inferior,
+    Superior,
+    Equal,
+    Different,
+    Equivalence,
+    Implication,
+    Negation,
+    And,
+    Or,
+    Xor,
+)
+
+
+class Factory:
+    def __init__(self) -> None:
+        self._table = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def make(self, cls: type, *args: typing.Any) -> typing.Any:
+        args = cls.canonical(args)
+
+        try:
+            key = (cls, tuple(map(_typed, args)))
+            model = self._table.get(key)
+        except TypeError:
+            return cls(*args)
+
+        if model is None:
+            model = cls(*args)
+            self._table[key] = model
+
+        return model
+
+    def intern(self, model: typing.Any) -> typing.Any:
+        memo = {}
+
+        def visit(model: typing.Any) -> typing.Any:
+            if not isinstance(model, Model):
+                return model
+
+            if id(model) not in memo:
+                memo[id(model)] = self._intern(
+                    model, list(map(visit, model.parameters))
+                )
+
+            return memo[id(model)]
+
+        return visit(model)
+
+    def _intern(self, model: "Model", parameters: list[typing.Any]) -> typing.Any:
+        if all(map(operator.is_, parameters, model.parameters)):
+            try:
+                key = (type(model), tuple(map(_typed, parameters)))
+
+                if self._table.get(key) is model:
+                    return model
+            except TypeError:
+                pass
+
+        return self.make(type(model), *parameters)
+
+
+def _boolean(parameter: typing.Any) -> bool:
+    return isinstance(parameter, bool)
+
+
+def _integer(parameter: typing.Any) -> bool:
+    return isinstance(parameter, int) and not isinstance(parameter, bool)
+
+
+def _divide(left: int, right: int) -> int:
+    if right == 0 or left % right:
+        raise ArithmeticError()
+
+    return left // right
+
+
+ARITHMETIC = {
+    Addition: sum,
+    Subtraction: functools.partial(functools.reduce, operator.sub),
+    Multiplication: functools.partial(functools.reduce, operator.mul),
+    Division: functools.partial(functools.reduce, _divide),
+    Minimum: min,
+    Maximum: max,
+}
+
+COMPARISONS = {
+    (Inferior, "Inclusive"): operator.le,
+    (Inferior, "Exclusive"): operator.lt,
+    (Superior, "Inclusive"): operator.ge,
+    (Superior, "Exclusive"): operator.gt,
+}
+
+IDENTITIES = {And: (True, False), Or: (False, True)}
+
+
+def _fold(
+    cls: type,
+    parameters: list[typing.Any],
+    make: typing.Callable[..., typing.Any],
+    original: typing.Any = None,
+) -> typing.Any:
+    if cls in ARITHMETIC and parameters and all(map(_integer, parameters)):
+        try:
+            return ARITHMETIC[cls](parameters)
+        except ArithmeticError:
+            pass
+
+    if cls in (Equal, Different) and len(parameters) == 2:
+        if all(map(_integer, parameters)):
+            return (parameters[0] == parameters[1]) == (cls is Equal)
+
+    if cls in (Inferior, Superior) and len(parameters) == 3:
+        comparison = COMPARISONS.get((cls, parameters[2]))
+
+        if comparison is not None and all(map(_integer, parameters[:2])):
+            return comparison(parameters[0], parameters[1])
+
+    if cls is Negation and len(parameters) == 1:
+        (parameter,) = parameters
+
+        if _boolean(parameter):
+            return not parameter
+
+        if isinstance(parameter, Negation) and len(parameter.parameters) == 1:
+            return parameter.parameters[0]
+
+    if cls in IDENTITIES:
+        identity, absorbing = IDENTITIES[cls]
+        flattened = []
+
+        for parameter in parameters:
+            if isinstance(parameter, cls):
+                flattened.extend(parameter.parameters)
+            else:
+                flattened.append(parameter)
+
+        if any(parameter is absorbing for parameter in flattened):
+            return absorbing
+
+        flattened = [parameter for parameter in flattened if parameter is not identity]
+
+        if not flattened:
+            return identity
+
+        if len(flattened) == 1:
+            return flattened[0]
+
+        parameters = flattened
+
+    if cls in (Equivalence, Xor) and len(parameters) == 2:
+        left, right = parameters
+
+        if _boolean(left) and _boolean(right):
+            return (left == right) == (cls is Equivalence)
+
+        if _boolean(right):
+            left, right = right, left
+
+        if _boolean(left):
+            if left == (cls is Equivalence):
+                return right
+
+            return _fold(Negation, [right], make)
+
+    if cls is Implication and len(parameters) == 2:
+        left, right = parameters
+
+        if left is False or right is True:
+            return True
+
+        if left is True:
+            return right
+
+        if right is False:
+            return _fold(Negation, [left], make)
 
+    if (
+        original is not None
+        and len(parameters) == len(original.parameters)
+        and all(
+            parameter is previous
+            for parameter, previous in zip(parameters, original.parameters)
+        )
+    ):
+        return original
 
-class Implication:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+    return make(cls, *parameters)
 
 
-class Negation:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+def _construct(cls: type, *args: typing.Any) -> typing.Any:
+    return cls(*args)
 
 
-class And:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+def simplify(model: typing.Any, factory: typing.Optional[Factory] = None) -> typing.Any:
+    make = factory.make if factory is not None else _construct
+    memo = {}
 
+    def visit(model: typing.Any) -> typing.Any:
+        if not isinstance(model, Model):
+            return model
 
-class Or:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+        if id(model) not in memo:
+            memo[id(model)] = _fold(
+                type(model),
+                list(map(visit, model.parameters)),
+                make,
+                model if factory is None else None,
+            )
 
+        return memo[id(model)]
 
-class Xor:
-    def __init__(self, *args: list[typing.Any]) -> None:
-        self.parameters = args
+    return visit(model)
@@ -0,0 +1,211 @@
+import array
+import typing
+import uuid
+
+from solvent import modeling
+
+
+OPCODES = {cls: opcode for opcode, cls in enumerate(modeling.MODELS)}
+
+buffer = typing.Union[array.array, memoryview]
+
+
+class Ref:
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class Packed:
+    def __init__(
+        self,
+        opcodes: typing.Optional[buffer] = None,
+        offsets: typing.Optional[buffer] = None,
+        operands: typing.Optional[buffer] = None,
+        roots: typing.Optional[buffer] = None,
+        owners: typing.Optional[typing.Union[bytearray, memoryview]] = None,
+        pool: typing.Optional[list[typing.Any]] = None,
+    ) -> None:
+        self.opcodes = opcodes if opcodes is not None else array.array("B")
+        self.offsets = offsets if offsets is not None else array.array("q", [0])
+        self.operands = operands if operands is not None else array.array("q")
+        self.roots = roots if roots is not None else array.array("q")
+        self.owners = owners if owners is not None else bytearray()
+        self.pool = pool if pool is not None else []
+
+        self._keys = {}
+        self._literals = {}
+
+        if self.writable:
+            for index in range(len(self.opcodes)):
+                self._keys[(self.opcodes[index], tuple(self._operands(index)))] = index
+
+            for index, literal in enumerate(self.pool):
+                try:
+                    self._literals.setdefault((type(literal), literal), index)
+                except TypeError:
+                    pass
+
+    @classmethod
+    def from_models(
+        cls,
+        models: typing.Iterable[typing.Any],
+        owners: typing.Optional[typing.Iterable[uuid.UUID]] = None,
+    ) -> "Packed":
+        packed = cls()
+
+        if owners is None:
+            for model in models:
+                packed.add(model)
+        else:
+            for model, owner in zip(models, owners):
+                packed.add(model, owner)
+
+        return packed
+
+    @classmethod
+    def from_buffers(
+        cls,
+        opcodes: typing.Any,
+        offsets: typing.Any,
+        operands: typing.Any,
+        roots: typing.Any,
+        owners: typing.Any,
+        pool: list[typing.Any],
+    ) -> "Packed":
+        return cls(
+            memoryview(opcodes).cast("B"),
+            memoryview(offsets).cast("B").cast("q"),
+            memoryview(operands).cast("B").cast("q"),
+            memoryview(roots).cast("B").cast("q"),
+            memoryview(owners).cast("B"),
+            list(pool),
+        )
+
+    def __reduce__(self) -> tuple[typing.Callable, tuple[typing.Any, ...]]:
+        return Packed, (
+            array.array("B", bytes(self.opcodes)),
+            array.array("q", self.offsets),
+            array.array("q", self.operands),
+            array.array("q", self.roots),
+            bytearray(self.owners),
+            list(self.pool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.roots)
+
+    @property
+    def size(self) -> int:
+        return len(self.opcodes)
+
+    @property
+    def writable(self) -> bool:
+        return isinstance(self.opcodes, array.array)
+
+    def export(self) -> dict[str, typing.Any]:
+        return {
+            "opcodes": memoryview(self.opcodes),
+            "offsets": memoryview(self.offsets),
+            "operands": memoryview(self.operands),
+            "roots": memoryview(self.roots),
+            "owners": memoryview(self.owners),
+            "pool": self.pool,
+        }
+
+    def _operands(self, index: int) -> typing.Any:
+        return self.operands[self.offsets[index] : self.offsets[index + 1]]
+
+    def _literal(self, value: typing.Any) -> int:
+        try:
+            key = (type(value), value)
+            index = self._literals.get(key)
+        except TypeError:
+            key = None
+            index = None
+
+        if index is None:
+            index = len(self.pool)
+            self.pool.append(value)
+
+            if key is not None:
+                self._literals[key] = index
+
+        return -(index + 1)
+
+    def _encode(self, parameter: typing.Any) -> int:
+        if isinstance(parameter, Ref):
+            return parameter.index
+
+        return self._literal(parameter)
+
+    def make(self, cls: type, *args: typing.Any) -> Ref:
+        if not self.writable:
+            raise TypeError()
+
+        opcode = OPCODES[cls]
+        operands = tuple(map(self._encode, args))
+
+        if cls.commutative:
+            operands = tuple(sorted(operands))
+
+        key = (opcode, operands)
+        index = self._keys.get(key)
+
+        if index is None:
+            index = len(self.opcodes)
+            self._keys[key] = index
+            self.opcodes.append(opcode)
+            self.operands.extend(operands)
+            self.offsets.append(len(self.operands))
+
+        return Ref(index)
+
+    def intern(self, model: typing.Any) -> typing.Any:
+        memo = {}
+
+        def visit(model: typing.Any) -> typing.Any:
+            if not isinstance(model, modeling.Model):
+                return model
+
+            if id(model) not in memo:
+                memo[id(model)] = self.make(type(model), *map(visit, model.parameters))
+
+            return memo[id(model)]
+
+        return visit(model)
+
+    def add(self, model: typing.Any, owner: typing.Optional[uuid.UUID] = None) -> int:
+        if not self.writable:
+            raise TypeError()
+
+        self.roots.append(self._encode(self.intern(model)))
+        self.owners.extend(owner.bytes if owner is not None else bytes(16))
+
+        return len(self.roots) - 1
+
+    def owner(self, position: int) -> typing.Optional[uuid.UUID]:
+        data = bytes(self.owners[16 * position : 16 * position + 16])
+
+        return uuid.UUID(bytes=data) if any(data) else None
+
+    def _decode(self, operand: int, memo: dict[int, typing.Any]) -> typing.Any:
+        if operand < 0:
+            return self.pool[-operand - 1]
+
+        if operand not in memo:
+            cls = modeling.MODELS[self.opcodes[operand]]
+            memo[operand] = cls(
+                *[self._decode(child, memo) for child in self._operands(operand)]
+            )
+
+        return memo[operand]
+
+    def __getitem__(self, position: int) -> typing.Any:
+        return self._decode(self.roots[position], {})
+
+    def models(self) -> list[typing.Any]:
+        memo = {}
+
+        return [self._decode(root, memo) for root in self.roots]
@@ -0,0 +1,233 @@
+import collections
+import typing
+import uuid
+
+from solvent import graph
+
+
+class SubGraph:
+    def __init__(
+        self,
+        mgraph: graph.MGraph,
+        node_ids: typing.Iterable[uuid.UUID],
+        connection_ids: typing.Iterable[uuid.UUID],
+        external_ids: typing.Iterable[uuid.UUID] = (),
+    ) -> None:
+        self.parent = mgraph
+        self.version = mgraph.version
+
+        self._node_ids = dict.fromkeys(node_ids)
+        self._connection_ids = dict.fromkeys(connection_ids)
+        self._external_ids = dict.fromkeys(external_ids)
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self._node_ids)
+
+    def __reduce__(self) -> tuple[typing.Callable, tuple[typing.Any, ...]]:
+        return _restore, (self.nodes, self.connections, self.external)
+
+    @property
+    def nodes(self) -> list[graph.Node]:
+        return list(self.iter_nodes())
+
+    @property
+    def connections(self) -> list[graph.Connection]:
+        return list(self.iter_connections())
+
+    def iter_nodes(self) -> typing.Iterator[graph.Node]:
+        return (
+            node
+            for node in map(self.parent.get_node, self._node_ids)
+            if node is not None
+        )
+
+    def iter_connections(self) -> typing.Iterator[graph.Connection]:
+        return (
+            connection
+            for connection in map(self.parent.get_connection, self._connection_ids)
+            if connection is not None
+        )
+
+    @property
+    def external(self) -> list[graph.Connection]:
+        return [
+            connection
+            for connection in map(self.parent.get_connection, self._external_ids)
+            if connection is not None
+        ]
+
+    def cached(
+        self, key: typing.Hashable, builder: typing.Callable[["SubGraph"], typing.Any]
+    ) -> typing.Any:
+        if self.version != self.parent.version:
+            self._cache.clear()
+            self.version = self.parent.version
+
+        if key not in self._cache:
+            self._cache[key] = builder(self)
+
+        return self._cache[key]
+
+    def get_node(self, id: uuid.UUID) -> typing.Optional[graph.Node]:
+        return self.parent.get_node(id) if id in self._node_ids else None
+
+    def get_connection(self, id: uuid.UUID) -> typing.Optional[graph.Connection]:
+        return self.parent.get_connection(id) if id in self._connection_ids else None
+
+    def _filter(
+        self, connections: typing.Optional[list[graph.Connection]]
+    ) -> typing.Optional[list[graph.Connection]]:
+        connections = [
+            connection
+            for connection in connections or []
+            if connection.id in self._connection_ids
+        ]
+
+        return connections if connections else None
+
+    def get_connections_from_source(
+        self, id: uuid.UUID
+    ) -> typing.Optional[list[graph.Connection]]:
+        return self._filter(self.parent.get_connections_from_source(id))
+
+    def get_connections_from_destination(
+        self, id: uuid.UUID
+    ) -> typing.Optional[list[graph.Connection]]:
+        return self._filter(self.parent.get_connections_from_destination(id))
+
+    def to_graph(self) -> graph.MGraph:
+        return graph.MGraph.from_components(self.nodes, self.connections)
+
+
+def _restore(
+    nodes: list[graph.Node],
+    connections: list[graph.Connection],
+    external: list[graph.Connection],
+) -> SubGraph:
+    return SubGraph(
+        graph.MGraph.from_components(nodes, connections + external),
+        [node.id for node in nodes],
+        [connection.id for connection in connections],
+        [connection.id for connection in external],
+    )
+
+
+def _type(connection: graph.Connection) -> typing.Any:
+    return connection.get("type")
+
+
+def _endpoints(connection: graph.Connection) -> list[uuid.UUID]:
+    return [connection.source.id] + [
+        destination.id for destination in connection.destinations
+    ]
+
+
+def _assemble(
+    mgraph: graph.MGraph, owners: dict[uuid.UUID, typing.Hashable]
+) -> list[SubGraph]:
+    members = collections.defaultdict(list)
+    internal = collections.defaultdict(list)
+    external = collections.defaultdict(list)
+
+    for id, owner in owners.items():
+        members[owner].append(id)
+
+    for connection in mgraph.connections:
+        partitions = {owners.get(id) for id in _endpoints(connection)}
+
+        if len(partitions) == 1 and None not in partitions:
+            internal[partitions.pop()].append(connection.id)
+        else:
+            for partition in partitions - {None}:
+                external[partition].append(connection.id)
+
+    return [
+        SubGraph(mgraph, members[owner], internal[owner], external[owner])
+        for owner in members
+    ]
+
+
+def components(
+    mgraph: graph.MGraph, ignore: typing.Iterable[str] = graph.CROSS_TREE
+) -> list[SubGraph]:
+    ignore = frozenset(ignore)
+    parents = {}
+
+    def find(id: uuid.UUID) -> uuid.UUID:
+        root = id
+
+        while parents[root] != root:
+            root = parents[root]
+
+        while parents[id] != root:
+            parents[id], id = root, parents[id]
+
+        return root
+
+    for node in mgraph.nodes:
+        parents[node.id] = node.id
+
+    for connection in mgraph.connections:
+        endpoints = _endpoints(connection)
+
+        for id in endpoints:
+            parents.setdefault(id, id)
+
+        if _type(connection) in ignore:
+            continue
+
+        root = find(endpoints[0])
+
+        for id in endpoints[1:]:
+            other = find(id)
+
+            if other != root:
+                parents[other] = root
+
+    return _assemble(mgraph, {id: find(id) for id in parents})
+
+
+def subtrees(
+    mgraph: graph.MGraph,
+    root: typing.Optional[uuid.UUID] = None,
+    ignore: typing.Iterable[str] = graph.CROSS_TREE,
+) -> list[SubGraph]:
+    ignore = frozenset(ignore)
+
+    def children(id: uuid.UUID) -> typing.Iterator[uuid.UUID]:
+        for connection in mgraph.get_connections_from_source(id) or []:
+            if _type(connection) not in ignore:
+                for destination in connection.destinations:
+                    if destination.id != id:
+                        yield destination.id
+
+    def has_parent(id: uuid.UUID) -> bool:
+        return any(
+            _type(connection) not in ignore and connection.source.id != id
+            for connection in mgraph.get_connections_from_destination(id) or []
+        )
+
+    if root is None:
+        starts = [node.id for node in mgraph.nodes if not has_parent(node.id)]
+        owners = {}
+    else:
+        starts = list(dict.fromkeys(children(root)))
+        owners = {root: None}
+
+    for start in starts:
+        if start in owners:
+            continue
+
+        owners[start] = start
+        queue = collections.deque([start])
+
+        while queue:
+            for child in children(queue.popleft()):
+                if child not in owners:
+                    owners[child] = start
+                    queue.append(child)
+
+    return _assemble(
+        mgraph, {id: owner for id, owner in owners.items() if owner is not None}
+    )
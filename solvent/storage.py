@@ -0,0 +1,551 @@
+import array
+import io
+import mmap
+import pickle
+import struct
+import typing
+import uuid
+
+from solvent import adjacency, graph
+
+
+MAGIC = b"SOLVENT\x01"
+
+SECTIONS = (
+    "string_offsets",
+    "string_data",
+    "uuids",
+    "values",
+    "keys",
+    "schema_offsets",
+    "schema_keys",
+    "node_ids",
+    "node_order",
+    "node_flags",
+    "node_schemas",
+    "node_columns",
+    "connection_ids",
+    "connection_order",
+    "connection_schemas",
+    "connection_columns",
+    "connection_sources",
+    "connection_destination_offsets",
+    "connection_destinations",
+    "source_offsets",
+    "source_connections",
+    "destination_offsets",
+    "destination_connections",
+)
+
+NONE, BOOLEAN, INTEGER, FLOAT, STRING, UUID, PICKLE = range(7)
+
+BYTE_SECTIONS = ("string_data", "uuids", "node_ids", "node_flags", "connection_ids")
+
+REGISTERED = 1
+
+PICKLABLE = (type(None), bool, int, float, str, bytes, uuid.UUID)
+
+
+def _picklable(value: typing.Any) -> bool:
+    match value:
+        case list() | tuple() | set() | frozenset():
+            return all(map(_picklable, value))
+        case dict():
+            return _picklable(list(value.items()))
+        case _:
+            return type(value) in PICKLABLE
+
+
+class _Unpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> typing.Any:
+        if (module, name) != ("uuid", "UUID"):
+            raise pickle.UnpicklingError()
+
+        return uuid.UUID
+
+
+def _loads(data: bytes) -> typing.Any:
+    return _Unpickler(io.BytesIO(data)).load()
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.strings = []
+        self.string_index = {}
+        self.uuids = []
+        self.uuid_index = {}
+        self.values = array.array("q")
+        self.value_index = {}
+        self.keys = array.array("q")
+        self.key_index = {}
+        self.schema_offsets = array.array("q", [0])
+        self.schema_keys = array.array("q")
+        self.schema_index = {}
+
+    def string(self, data: bytes) -> int:
+        index = self.string_index.get(data)
+
+        if index is None:
+            index = len(self.strings)
+            self.string_index[data] = index
+            self.strings.append(data)
+
+        return index
+
+    def uuid(self, id: uuid.UUID) -> int:
+        index = self.uuid_index.get(id)
+
+        if index is None:
+            index = len(self.uuids)
+            self.uuid_index[id] = index
+            self.uuids.append(id.bytes)
+
+        return index
+
+    def encode(self, value: typing.Any) -> tuple[int, int]:
+        match value:
+            case None:
+                return NONE, 0
+            case bool():
+                return BOOLEAN, int(value)
+            case int() if -(2**63) <= value < 2**63:
+                return INTEGER, value
+            case float():
+                return FLOAT, struct.unpack("<q", struct.pack("<d", value))[0]
+            case str():
+                return STRING, self.string(value.encode())
+            case uuid.UUID():
+                return UUID, self.uuid(value)
+            case _ if _picklable(value):
+                return PICKLE, self.string(pickle.dumps(value))
+            case _:
+                raise ValueError()
+
+    def value(self, value: typing.Any) -> int:
+        tag, payload = self.encode(value)
+        index = self.value_index.get((tag, payload))
+
+        if index is None:
+            index = len(self.values) // 2
+            self.value_index[(tag, payload)] = index
+            self.values.extend((tag, payload))
+
+        return index
+
+    def key(self, key: str) -> int:
+        index = self.key_index.get(key)
+
+        if index is None:
+            index = len(self.keys)
+            self.key_index[key] = index
+            self.keys.append(self.string(key.encode()))
+
+        return index
+
+    def schema(self, keys: tuple[int, ...]) -> int:
+        index = self.schema_index.get(keys)
+
+        if index is None:
+            index = len(self.schema_offsets) - 1
+            self.schema_index[keys] = index
+            self.schema_keys.extend(keys)
+            self.schema_offsets.append(len(self.schema_keys))
+
+        return index
+
+    def rows(
+        self, components: list[graph.component]
+    ) -> tuple[array.array, list[dict[int, int]]]:
+        schemas = array.array("q")
+        rows = []
+
+        for component in components:
+            row = {
+                self.key(key): self.value(value)
+                for key, value in component.parameters.items()
+                if key not in graph.STRUCTURAL_KEYS
+            }
+
+            schemas.append(self.schema(tuple(row)))
+            rows.append(row)
+
+        return schemas, rows
+
+    def columns(self, rows: list[dict[int, int]]) -> array.array:
+        columns = array.array("q", [-1]) * (len(self.keys) * len(rows))
+
+        for position, row in enumerate(rows):
+            for key, value in row.items():
+                columns[key * len(rows) + position] = value
+
+        return columns
+
+
+def _order(ids: list[bytes]) -> array.array:
+    return array.array("q", sorted(range(len(ids)), key=ids.__getitem__))
+
+
+def save(mgraph: graph.MGraph, path: str) -> None:
+    writer = _Writer()
+
+    nodes = list(mgraph.nodes)
+    connections = list(mgraph.connections)
+    node_index = {node.id: position for position, node in enumerate(nodes)}
+    flags = array.array("B", [REGISTERED]) * len(nodes)
+
+    for connection in connections:
+        for node in (connection.source, *connection.destinations):
+            if node.id not in node_index:
+                node_index[node.id] = len(nodes)
+                nodes.append(node)
+                flags.append(0)
+
+    for component in (*nodes, *connections):
+        if not isinstance(component.id, uuid.UUID):
+            raise ValueError()
+
+    node_schemas, node_rows = writer.rows(nodes)
+    connection_schemas, connection_rows = writer.rows(connections)
+
+    connection_sources = array.array(
+        "q", [node_index[connection.source.id] for connection in connections]
+    )
+    destination_rows = array.array("q")
+    destination_columns = array.array("q")
+
+    for position, connection in enumerate(connections):
+        for destination in connection.destinations:
+            destination_rows.append(position)
+            destination_columns.append(node_index[destination.id])
+
+    sources = adjacency.CSR.from_pairs(
+        len(nodes), connection_sources, array.array("q", range(len(connections)))
+    )
+    destinations = adjacency.CSR.from_pairs(
+        len(nodes), destination_columns, destination_rows
+    )
+    connection_destinations = adjacency.CSR.from_pairs(
+        len(connections), destination_rows, destination_columns
+    )
+
+    node_ids = [node.id.bytes for node in nodes]
+    connection_ids = [connection.id.bytes for connection in connections]
+
+    string_offsets = array.array("q", [0])
+
+    for string in writer.strings:
+        string_offsets.append(string_offsets[-1] + len(string))
+
+    sections = {
+        "string_offsets": string_offsets,
+        "string_data": b"".join(writer.strings),
+        "uuids": b"".join(writer.uuids),
+        "values": writer.values,
+        "keys": writer.keys,
+        "schema_offsets": writer.schema_offsets,
+        "schema_keys": writer.schema_keys,
+        "node_ids": b"".join(node_ids),
+        "node_order": _order(node_ids),
+        "node_flags": flags,
+        "node_schemas": node_schemas,
+        "node_columns": writer.columns(node_rows),
+        "connection_ids": b"".join(connection_ids),
+        "connection_order": _order(connection_ids),
+        "connection_schemas": connection_schemas,
+        "connection_columns": writer.columns(connection_rows),
+        "connection_sources": connection_sources,
+        "connection_destination_offsets": connection_destinations._offsets,
+        "connection_destinations": connection_destinations._columns,
+        "source_offsets": sources._offsets,
+        "source_connections": sources._columns,
+        "destination_offsets": destinations._offsets,
+        "destination_connections": destinations._columns,
+    }
+
+    header = len(MAGIC) + 8 * (2 * len(SECTIONS) + 3)
+    offset = header
+    table = array.array("q", [len(nodes), len(connections), len(writer.keys)])
+    blobs = []
+
+    for name in SECTIONS:
+        blob = bytes(sections[name])
+        padding = -len(blob) % 8
+        table.extend((offset, len(blob)))
+        blobs.append(blob + bytes(padding))
+        offset += len(blob) + padding
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(table.tobytes())
+
+        for blob in blobs:
+            file.write(blob)
+
+
+class MappedGraph:
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._buffer = memoryview(self._mmap)
+
+        if bytes(self._buffer[: len(MAGIC)]) != MAGIC:
+            self._buffer.release()
+            self._mmap.close()
+            raise ValueError()
+
+        table = self._buffer[len(MAGIC) : len(MAGIC) + 8 * (2 * len(SECTIONS) + 3)]
+        table = table.cast("q")
+
+        self._node_count, self._connection_count, self._key_count = table[:3]
+        self._sections = {}
+
+        for position, name in enumerate(SECTIONS):
+            offset, length = table[3 + 2 * position], table[4 + 2 * position]
+            self._sections[name] = self._buffer[offset : offset + length]
+
+        table.release()
+
+        self._views = {
+            name: view.cast("q")
+            for name, view in self._sections.items()
+            if name not in BYTE_SECTIONS
+        }
+
+        self._nodes = {}
+        self._connections = {}
+        self._strings = {}
+        self._values = {}
+
+        self.version = 0
+        self._cache = {}
+
+    def close(self) -> None:
+        self._nodes.clear()
+        self._connections.clear()
+        self._cache.clear()
+
+        for view in self._views.values():
+            view.release()
+
+        for view in self._sections.values():
+            view.release()
+
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedGraph":
+        return self
+
+    def __exit__(self, *args: list[typing.Any]) -> None:
+        self.close()
+
+    def _string(self, index: int) -> bytes:
+        data = self._strings.get(index)
+
+        if data is None:
+            offsets = self._views["string_offsets"]
+            data = bytes(
+                self._sections["string_data"][offsets[index] : offsets[index + 1]]
+            )
+            self._strings[index] = data
+
+        return data
+
+    def _uuid(self, section: str, index: int) -> uuid.UUID:
+        return uuid.UUID(
+            bytes=bytes(self._sections[section][16 * index : 16 * index + 16])
+        )
+
+    def _value(self, index: int) -> typing.Any:
+        if index in self._values:
+            return self._values[index]
+
+        values = self._views["values"]
+        tag, payload = values[2 * index], values[2 * index + 1]
+
+        if tag == NONE:
+            value = None
+        elif tag == BOOLEAN:
+            value = bool(payload)
+        elif tag == INTEGER:
+            value = payload
+        elif tag == FLOAT:
+            value = struct.unpack("<d", struct.pack("<q", payload))[0]
+        elif tag == STRING:
+            value = self._string(payload).decode()
+        elif tag == UUID:
+            value = self._uuid("uuids", payload)
+        else:
+            value = _loads(self._string(payload))
+
+        if tag != PICKLE:
+            self._values[index] = value
+
+        return value
+
+    def _parameters(self, kind: str, index: int, count: int) -> dict[str, typing.Any]:
+        schemas = self._views["schema_offsets"]
+        schema = self._views[f"{kind}_schemas"][index]
+        columns = self._views[f"{kind}_columns"]
+        keys = self._views["keys"]
+        parameters = {}
+
+        for key in self._views["schema_keys"][schemas[schema] : schemas[schema + 1]]:
+            name = self._string(keys[key]).decode()
+            parameters[name] = self._value(columns[key * count + index])
+
+        return parameters
+
+    def _search(self, section: str, order: str, id: uuid.UUID) -> typing.Optional[int]:
+        target = id.bytes
+        permutation = self._views[order]
+        ids = self._sections[section]
+        low, high = 0, len(permutation)
+
+        while low < high:
+            middle = (low + high) // 2
+            position = permutation[middle]
+            current = bytes(ids[16 * position : 16 * position + 16])
+
+            if current < target:
+                low = middle + 1
+            elif current > target:
+                high = middle
+            else:
+                return position
+
+        return None
+
+    def _node(self, index: int) -> graph.Node:
+        node = self._nodes.get(index)
+
+        if node is None:
+            node = graph.Node(**self._parameters("node", index, self._node_count))
+            self._nodes[index] = node
+
+        return node
+
+    def _connection(self, index: int) -> graph.Connection:
+        connection = self._connections.get(index)
+
+        if connection is None:
+            offsets = self._views["connection_destination_offsets"]
+            destinations = self._views["connection_destinations"]
+            parameters = self._parameters("connection", index, self._connection_count)
+            parameters["source"] = self._node(self._views["connection_sources"][index])
+            parameters["destinations"] = [
+                self._node(destination)
+                for destination in destinations[offsets[index] : offsets[index + 1]]
+            ]
+
+            connection = graph.Connection(**parameters)
+            self._connections[index] = connection
+
+        return connection
+
+    def _registered(self, index: int) -> bool:
+        return bool(self._sections["node_flags"][index] & REGISTERED)
+
+    @property
+    def nodes(self) -> list[graph.Node]:
+        return list(self.iter_nodes())
+
+    @property
+    def connections(self) -> list[graph.Connection]:
+        return list(self.iter_connections())
+
+    def iter_nodes(self) -> typing.Iterator[graph.Node]:
+        return (
+            self._node(index)
+            for index in range(self._node_count)
+            if self._registered(index)
+        )
+
+    def iter_connections(self) -> typing.Iterator[graph.Connection]:
+        return (self._connection(index) for index in range(self._connection_count))
+
+    def cached(
+        self,
+        key: typing.Hashable,
+        builder: typing.Callable[["MappedGraph"], typing.Any],
+    ) -> typing.Any:
+        if key not in self._cache:
+            self._cache[key] = builder(self)
+
+        return self._cache[key]
+
+    def node_index(self, id: uuid.UUID) -> typing.Optional[int]:
+        return self._search("node_ids", "node_order", id)
+
+    def node_id(self, index: int) -> uuid.UUID:
+        return self._uuid("node_ids", index)
+
+    def connection_index(self, id: uuid.UUID) -> typing.Optional[int]:
+        return self._search("connection_ids", "connection_order", id)
+
+    def connection_id(self, index: int) -> uuid.UUID:
+        return self._uuid("connection_ids", index)
+
+    def _build_adjacency(self) -> adjacency.Adjacency:
+        return adjacency.Adjacency(
+            adjacency.CSR(
+                self._views["source_offsets"], self._views["source_connections"]
+            ),
+            adjacency.CSR(
+                self._views["destination_offsets"],
+                self._views["destination_connections"],
+            ),
+            self._views["connection_sources"],
+            adjacency.CSR(
+                self._views["connection_destination_offsets"],
+                self._views["connection_destinations"],
+            ),
+        )
+
+    def adjacency(self) -> adjacency.Adjacency:
+        return self.cached("adjacency", MappedGraph._build_adjacency)
+
+    def get_node(self, id: uuid.UUID) -> typing.Optional[graph.Node]:
+        index = self.node_index(id)
+
+        if index is None or not self._registered(index):
+            return None
+
+        return self._node(index)
+
+    def get_connection(self, id: uuid.UUID) -> typing.Optional[graph.Connection]:
+        index = self.connection_index(id)
+
+        return self._connection(index) if index is not None else None
+
+    def _incident(
+        self, offsets: str, connections: str, id: uuid.UUID
+    ) -> typing.Optional[list[graph.Connection]]:
+        index = self.node_index(id)
+
+        if index is None:
+            return None
+
+        start, end = self._views[offsets][index], self._views[offsets][index + 1]
+
+        if start == end:
+            return None
+
+        return [
+            self._connection(connection)
+            for connection in self._views[connections][start:end]
+        ]
+
+    def get_connections_from_source(
+        self, id: uuid.UUID
+    ) -> typing.Optional[list[graph.Connection]]:
+        return self._incident("source_offsets", "source_connections", id)
+
+    def get_connections_from_destination(
+        self, id: uuid.UUID
+    ) -> typing.Optional[list[graph.Connection]]:
+        return self._incident("destination_offsets", "destination_connections", id)
+
+    def to_graph(self) -> graph.MGraph:
+        return graph.MGraph.from_components(self.nodes, self.connections)
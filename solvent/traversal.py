@@ -0,0 +1,188 @@
+import collections
+import typing
+import uuid
+
+from solvent import graph
+
+
+types = typing.Optional[typing.Iterable[str]]
+
+
+def _key(connection_types: types) -> typing.Optional[frozenset[str]]:
+    return frozenset(connection_types) if connection_types is not None else None
+
+
+def _follow(
+    connection: graph.Connection, connection_types: typing.Optional[frozenset[str]]
+) -> bool:
+    if connection_types is None:
+        return connection.get("type") not in graph.CROSS_TREE
+
+    return connection.get("type") in connection_types
+
+
+def _children(
+    mgraph: graph.MGraph,
+    id: uuid.UUID,
+    connection_types: typing.Optional[frozenset[str]],
+) -> typing.Iterator[uuid.UUID]:
+    for connection in mgraph.get_connections_from_source(id) or []:
+        if _follow(connection, connection_types):
+            for destination in connection.destinations:
+                if destination.id != id:
+                    yield destination.id
+
+
+def _parents(
+    mgraph: graph.MGraph,
+    id: uuid.UUID,
+    connection_types: typing.Optional[frozenset[str]],
+) -> typing.Iterator[uuid.UUID]:
+    for connection in mgraph.get_connections_from_destination(id) or []:
+        if _follow(connection, connection_types) and connection.source.id != id:
+            yield connection.source.id
+
+
+def _bfs(
+    start: uuid.UUID,
+    neighbors: typing.Callable[[uuid.UUID], typing.Iterator[uuid.UUID]],
+) -> tuple[uuid.UUID, ...]:
+    visited = {start}
+    order = [start]
+    queue = collections.deque([start])
+
+    while queue:
+        for neighbor in neighbors(queue.popleft()):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                order.append(neighbor)
+                queue.append(neighbor)
+
+    return tuple(order)
+
+
+def _dfs(
+    start: uuid.UUID,
+    neighbors: typing.Callable[[uuid.UUID], typing.Iterator[uuid.UUID]],
+) -> tuple[uuid.UUID, ...]:
+    visited = set()
+    order = []
+    stack = [start]
+
+    while stack:
+        current = stack.pop()
+
+        if current in visited:
+            continue
+
+        visited.add(current)
+        order.append(current)
+        stack.extend(reversed(list(neighbors(current))))
+
+    return tuple(order)
+
+
+def bfs(
+    mgraph: graph.MGraph, start: uuid.UUID, connection_types: types = None
+) -> tuple[uuid.UUID, ...]:
+    key = _key(connection_types)
+
+    return mgraph.cached(
+        ("bfs", start, key),
+        lambda mgraph: _bfs(start, lambda id: _children(mgraph, id, key)),
+    )
+
+
+def dfs(
+    mgraph: graph.MGraph, start: uuid.UUID, connection_types: types = None
+) -> tuple[uuid.UUID, ...]:
+    key = _key(connection_types)
+
+    return mgraph.cached(
+        ("dfs", start, key),
+        lambda mgraph: _dfs(start, lambda id: _children(mgraph, id, key)),
+    )
+
+
+def descendants(
+    mgraph: graph.MGraph, id: uuid.UUID, connection_types: types = None
+) -> tuple[uuid.UUID, ...]:
+    key = _key(connection_types)
+
+    return mgraph.cached(
+        ("descendants", id, key), lambda mgraph: bfs(mgraph, id, key)[1:]
+    )
+
+
+def ancestors(
+    mgraph: graph.MGraph, id: uuid.UUID, connection_types: types = None
+) -> tuple[uuid.UUID, ...]:
+    key = _key(connection_types)
+
+    return mgraph.cached(
+        ("ancestors", id, key),
+        lambda mgraph: _bfs(id, lambda id: _parents(mgraph, id, key))[1:],
+    )
+
+
+def subtree(
+    mgraph: graph.MGraph, id: uuid.UUID, connection_types: types = None
+) -> graph.MGraph:
+    key = _key(connection_types)
+    ids = bfs(mgraph, id, connection_types)
+    nodes = [mgraph.get_node(node) for node in ids]
+
+    return graph.MGraph.from_components(
+        [node for node in nodes if node is not None],
+        [
+            connection
+            for node in ids
+            for connection in mgraph.get_connections_from_source(node) or []
+            if _follow(connection, key)
+        ],
+    )
+
+
+def _topological_sort(
+    mgraph: graph.MGraph, connection_types: typing.Optional[frozenset[str]]
+) -> tuple[uuid.UUID, ...]:
+    degrees = {node.id: 0 for node in mgraph.nodes}
+
+    for connection in mgraph.connections:
+        degrees.setdefault(connection.source.id, 0)
+
+        for destination in connection.destinations:
+            degrees.setdefault(destination.id, 0)
+
+    for id in degrees:
+        for parent in _parents(mgraph, id, connection_types):
+            degrees[id] += 1
+
+    queue = collections.deque(id for id, degree in degrees.items() if degree == 0)
+    order = []
+
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+
+        for child in _children(mgraph, current, connection_types):
+            degrees[child] -= 1
+
+            if degrees[child] == 0:
+                queue.append(child)
+
+    if len(order) != len(degrees):
+        raise ValueError()
+
+    return tuple(order)
+
+
+def topological_sort(
+    mgraph: graph.MGraph, connection_types: types = None
+) -> tuple[uuid.UUID, ...]:
+    key = _key(connection_types)
+
+    return mgraph.cached(
+        ("topological_sort", key),
+        lambda mgraph: _topological_sort(mgraph, key),
+    )
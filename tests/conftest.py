@@ -0,0 +1,71 @@
+import pytest
+import uuid
+
+from solvent import graph, modeling
+
+
+@pytest.fixture
+def mgraph():
+    root = graph.Node(id=uuid.uuid4(), type="root", value=True)
+    children = [graph.Node(id=uuid.uuid4(), value=index % 2 == 0) for index in range(4)]
+
+    connections = [
+        graph.Connection(
+            id=uuid.uuid4(), type=type, source=root, destinations=destinations
+        )
+        for type, destinations in (
+            ("mandatory", children[:1]),
+            ("optional", children[1:2]),
+            ("or", children[2:]),
+            ("excludes", children[1:2]),
+        )
+    ]
+
+    return graph.MGraph.from_components([root] + children, connections)
+
+
+@pytest.fixture
+def feature_model(request):
+    extra = getattr(request, "param", [])
+    names = ["Mobile Phone", "Calls", "GPS", "Screen", "Basic", "Color"]
+    nodes = {
+        name: graph.Node(id=uuid.uuid4(), name=name)
+        for name in dict.fromkeys(names + [name for _, *ends in extra for name in ends])
+    }
+
+    def connect(type, source, *destinations):
+        return graph.Connection(
+            id=uuid.uuid4(),
+            type=type,
+            source=nodes[source],
+            destinations=[nodes[destination] for destination in destinations],
+        )
+
+    feature_model = graph.MGraph.from_components(
+        nodes.values(),
+        [
+            connect("mandatory", "Mobile Phone", "Calls"),
+            connect("optional", "Mobile Phone", "GPS"),
+            connect("mandatory", "Mobile Phone", "Screen"),
+            connect("or", "Screen", "Basic", "Color"),
+            connect("excludes", "Basic", "GPS"),
+        ]
+        + [connect(*connection) for connection in extra],
+    )
+    feature_model.names = {node.name: node.id for node in nodes.values()}
+
+    return feature_model
+
+
+@pytest.fixture
+def structure():
+    def structure(model):
+        if isinstance(model, (list, tuple)):
+            return [structure(item) for item in model]
+
+        if isinstance(model, modeling.MODELS):
+            return (type(model).__name__, structure(model.parameters))
+
+        return model
+
+    return structure
@@ -0,0 +1,127 @@
+import concurrent.futures
+import pytest
+import uuid
+
+from solvent import graph, mapping, modeling
+from solvent.mapping import batch
+
+
+RULES = {
+    "Node": "Boolean(Node.value)",
+    "Connection:mandatory": "Equivalence(Connection.source.value, Connection.destination.value)",
+    "Connection:or": "Xor(Connection.destinations.value)",
+}
+
+
+def test_select(mgraph):
+    assert len(batch.select(mgraph, "Node")) == 5
+    assert len(batch.select(mgraph, "Connection")) == 4
+    assert len(batch.select(mgraph, "Connection:optional")) == 1
+    assert batch.select(mgraph, "Connection:requires") == []
+
+
+@pytest.mark.parametrize("selector", ["Edge", "Connection:", "node"])
+def test_select_invalid(mgraph, selector):
+    with pytest.raises(ValueError):
+        batch.select(mgraph, selector)
+
+
+def test_apply_rules_list(mgraph):
+    models = mapping.apply_rules(mgraph, RULES)
+
+    assert len(models) == 7
+    assert all(isinstance(model, modeling.Boolean) for model in models[:5])
+    assert isinstance(models[5], modeling.Equivalence)
+    assert isinstance(models[6], modeling.Xor)
+    assert len(models[6].parameters) == 2
+
+
+def test_apply_rules_columnar(mgraph):
+    columns = mapping.apply_rules(mgraph, RULES, columnar=True)
+
+    assert list(columns) == list(RULES)
+    assert columns["Node"].ids == [node.id for node in mgraph.nodes]
+    assert len(columns["Node"].models) == 5
+    assert len(columns["Connection:or"].ids) == 1
+
+
+def test_apply_rules_process_pool(mgraph):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        columns = mapping.apply_rules(
+            mgraph, RULES, columnar=True, executor=executor, chunk_size=2
+        )
+
+    expected = mapping.apply_rules(mgraph, RULES, columnar=True)
+
+    for selector in RULES:
+        assert columns[selector].ids == expected[selector].ids
+        assert [type(model) for model in columns[selector].models] == [
+            type(model) for model in expected[selector].models
+        ]
+
+
+def test_apply_rules_sees_graph_changes(mgraph):
+    assert len(mapping.apply_rules(mgraph, {"Node": "Boolean(Node.value)"})) == 5
+
+    mgraph.add_node(graph.Node(id=uuid.uuid4(), value=False))
+
+    assert len(mapping.apply_rules(mgraph, {"Node": "Boolean(Node.value)"})) == 6
+
+
+def test_apply_rules_factory(mgraph):
+    factory = modeling.Factory()
+    models = mapping.apply_rules(
+        mgraph, {"Node": "Boolean(Node.value)"}, factory=factory
+    )
+
+    assert len({id(model) for model in models}) == 2
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        shared = mapping.apply_rules(
+            mgraph,
+            {"Node": "Boolean(Node.value)"},
+            executor=executor,
+            chunk_size=2,
+            factory=factory,
+        )
+
+    assert [id(model) for model in shared] == [id(model) for model in models]
+
+
+def test_iter_constraints(mgraph):
+    stream = mapping.iter_constraints(mgraph, RULES)
+    first = next(stream)
+    rest = list(stream)
+
+    assert first[0] == mgraph.nodes[0].id
+    assert isinstance(first[1], modeling.Boolean)
+    assert [id for id, _ in [first] + rest] == [
+        id
+        for column in mapping.apply_rules(mgraph, RULES, columnar=True).values()
+        for id in column.ids
+    ]
+
+
+def test_iter_constraints_validates_eagerly(mgraph):
+    with pytest.raises(TypeError):
+        mapping.iter_constraints(mgraph, {"Node": "Negation(1, 0)"})
+
+    with pytest.raises(ValueError):
+        mapping.iter_constraints(mgraph, {"Edge": "Negation(1)"})
+
+    with pytest.raises(ValueError):
+        mapping.iter_chunks(mgraph, RULES, chunk_size=0)
+
+
+def test_iter_chunks(mgraph):
+    chunks = list(mapping.iter_chunks(mgraph, RULES, chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [pair[0] for chunk in chunks for pair in chunk] == [
+        id for id, _ in mapping.iter_constraints(mgraph, RULES)
+    ]
+
+
+def test_iter_nodes_and_connections(mgraph):
+    assert list(mgraph.iter_nodes()) == mgraph.nodes
+    assert list(mgraph.iter_connections()) == mgraph.connections
@@ -0,0 +1,94 @@
+import pytest
+import uuid
+
+from solvent import graph, mapping, modeling
+from solvent.mapping import cache, interpreter
+
+
+@pytest.fixture
+def parse_cache():
+    calls = []
+
+    def parser(code):
+        calls.append(code)
+        return mapping.get_metamodel().model_from_str(code)
+
+    parse_cache = cache.ParseCache(parser, mapping.GRAMMAR_VERSION, maxsize=2)
+    parse_cache.calls = calls
+
+    return parse_cache
+
+
+def test_normalize():
+    assert (
+        cache.normalize(" Implication( Connection . source.value ,\n true ) ")
+        == "Implication(Connection.source.value,true)"
+    )
+
+
+def test_hits_and_misses(parse_cache):
+    first = parse_cache.parse("Negation(true)")
+    second = parse_cache.parse("Negation( true )")
+
+    assert first is second
+    assert parse_cache.calls == ["Negation(true)"]
+    assert parse_cache.info() == cache.CacheInfo(1, 1, 0, 2, 1)
+
+
+def test_least_recently_used_eviction(parse_cache):
+    parse_cache.parse("Negation(true)")
+    parse_cache.parse("Negation(false)")
+    parse_cache.parse("Negation(true)")
+    parse_cache.parse("And(true)")
+    parse_cache.parse("Negation(true)")
+    parse_cache.parse("Negation(false)")
+
+    assert parse_cache.calls == [
+        "Negation(true)",
+        "Negation(false)",
+        "And(true)",
+        "Negation(false)",
+    ]
+    assert parse_cache.info().currsize == 2
+
+
+def test_disk_store(tmp_path):
+    path = str(tmp_path / "rules")
+    writer = cache.ParseCache(mapping._parse, mapping.GRAMMAR_VERSION, path=path)
+    writer.parse("Inferior(Addition(1, Node.value), 3, Inclusive)")
+    writer.close()
+
+    reader = cache.ParseCache(None, mapping.GRAMMAR_VERSION, path=path)
+    constraint = reader.parse("Inferior(Addition(1, Node.value), 3, Inclusive)")
+    reader.close()
+
+    assert reader.info().disk_hits == 1
+    assert isinstance(constraint, interpreter.Relational)
+    assert isinstance(constraint.parameters[0], interpreter.Arithmetic)
+    assert constraint.parameters[0].parent is constraint
+    assert constraint.parameters[2] == "Inclusive"
+
+
+def test_disk_store_keyed_by_grammar_version(tmp_path):
+    path = str(tmp_path / "rules")
+    writer = cache.ParseCache(mapping._parse, "old", path=path)
+    writer.parse("Negation(true)")
+    writer.close()
+
+    reader = cache.ParseCache(mapping._parse, "new", path=path)
+    reader.parse("Negation(true)")
+    reader.close()
+
+    assert reader.info().disk_hits == 0
+    assert reader.info().misses == 1
+
+
+def test_cached_rule_to_model():
+    node = graph.Node(id=uuid.uuid4(), value=3)
+    constraint = mapping.parse("Equal(Node.value, Addition(1, 2))")
+
+    model = constraint.to_model(node)
+
+    assert isinstance(model, modeling.Equal)
+    assert model.parameters[0] == 3
+    assert mapping.parse("Equal(Node.value,Addition(1,2))") is constraint
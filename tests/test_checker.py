@@ -0,0 +1,165 @@
+import pytest
+import uuid
+
+from solvent import graph, mapping, modeling
+from solvent.mapping import checker, interpreter, registry
+
+
+@pytest.mark.parametrize(
+    "code, expectations",
+    [
+        ("Equivalence(true, false)", {}),
+        ("Negation(Node.value)", {("Node", ("value",)): checker.BOOL}),
+        (
+            "Implication(Node.value, Inferior(Node.size, 3, Inclusive))",
+            {("Node", ("value",)): checker.BOOL, ("Node", ("size",)): checker.INT},
+        ),
+        (
+            "Xor(Connection.destinations.value)",
+            {("Connection", ("destinations", "value")): checker.BOOL},
+        ),
+        ("Integer(Range(0, 10))", {}),
+        ("Integer(Node.value)", {("Node", ("value",)): checker.VARIABLE}),
+        ("Boolean(1)", {}),
+        ("Addition(1)", {}),
+    ],
+)
+def test_check_valid(code, expectations):
+    assert checker.check(mapping.parse(code)) == expectations
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "Negation(true, false)",
+        "Implication(true)",
+        "Equivalence(true)",
+        "Inferior(1, Inclusive, 2)",
+        "Equal(1, 2, Inclusive)",
+        "Inferior(1, 2, 3)",
+        "Subtraction(1)",
+        "Integer(true)",
+        "Boolean(5)",
+        "Boolean(Range(0, 1))",
+        "Integer(Range(5, 1))",
+        "Equivalence(Node.value, Inferior(Node.value, 1))",
+    ],
+)
+def test_check_invalid(code):
+    with pytest.raises(TypeError):
+        checker.check(mapping.parse(code))
+
+
+def test_check_constructed_trees():
+    tree = interpreter.Logic(
+        "And", [interpreter.Arithmetic("Addition", [1, 2, 3]), True]
+    )
+
+    with pytest.raises(TypeError):
+        checker.check(tree)
+
+    with pytest.raises(ValueError):
+        checker.check(interpreter.Logic("Nand", [True]))
+
+
+def test_check_arity_with_fan_out():
+    checker.check(mapping.parse("Implication(Connection.destinations.value)"))
+
+    with pytest.raises(TypeError):
+        checker.check(mapping.parse("Negation(true, false, Node.value)"))
+
+
+def test_compile_rejects_before_evaluation():
+    with pytest.raises(TypeError):
+        mapping.compile_rule("Integer(true)")
+
+    mapping.compile_rule("Integer(true)", check=False)
+
+
+def test_runtime_path_checks():
+    node = graph.Node(id=uuid.uuid4(), value=3)
+
+    with pytest.raises(TypeError):
+        mapping.compile_rule("Negation(Node.value)")(node)
+
+    assert mapping.compile_rule("Superior(Node.value, 1)")(node).parameters == (3, 1)
+    assert mapping.compile_rule("Negation(Node.value)", check=False)(node)
+
+    source = graph.Node(id=uuid.uuid4())
+    connection = graph.Connection(
+        id=uuid.uuid4(),
+        source=source,
+        destinations=[
+            graph.Node(id=uuid.uuid4(), value=True),
+            graph.Node(id=uuid.uuid4()),
+        ],
+    )
+
+    with pytest.raises(TypeError):
+        mapping.compile_rule("Or(Connection.destinations.value)")(connection)
+
+
+def test_check_mixed_entities():
+    with pytest.raises(TypeError):
+        mapping.compile_rule("And(Node.value, Connection.destinations.value)")
+
+
+def test_apply_rules_rejects_before_evaluation():
+    mgraph = graph.MGraph.from_components([graph.Node(id=uuid.uuid4(), value=True)], [])
+
+    with pytest.raises(TypeError):
+        mapping.apply_rules(
+            mgraph, {"Node": "Boolean(Node.value)", "Connection": "Negation(1, 0)"}
+        )
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("Boolean(Node.id)", modeling.Boolean),
+        ("Integer(Node.id)", modeling.Integer),
+        ("Integer(Node.id, Range(0, 1))", modeling.Integer),
+    ],
+)
+def test_variable_references(code, expected):
+    node = graph.Node(id=uuid.uuid4())
+    model = mapping.compile_rule(code)(node)
+
+    assert isinstance(model, expected)
+    assert model.parameters[0] == node.id
+
+
+def test_non_literal_values_are_references():
+    source, destination = graph.Node(id=uuid.uuid4()), graph.Node(id=uuid.uuid4())
+    connection = graph.Connection(
+        id=uuid.uuid4(), source=source, destinations=[destination]
+    )
+
+    model = mapping.compile_rule(
+        "Implication(Connection.source.id, Connection.destination.id)"
+    )(connection)
+
+    assert model.parameters == (source.id, destination.id)
+
+
+def test_check_flag_on_batch_paths():
+    mgraph = graph.MGraph.from_components([graph.Node(id=uuid.uuid4(), value=3)], [])
+    rules = {"Node": "Negation(Node.value)"}
+
+    assert len(mapping.apply_rules(mgraph, {"Node": "Boolean(Node.id)"})) == 1
+
+    for run in (
+        lambda check: mapping.apply_rules(mgraph, rules, check=check),
+        lambda check: list(mapping.iter_constraints(mgraph, rules, check=check)),
+        lambda check: list(mapping.iter_chunks(mgraph, rules, check=check)),
+        lambda check: mapping.pack_rules(mgraph, rules, check=check).models(),
+    ):
+        with pytest.raises(TypeError):
+            run(True)
+
+        assert len(run(False)) == 1
+
+    rules = registry.Registry(check=False)
+    rules.register("Node", "Negation(1, 0)")
+
+    assert len(rules) == 1
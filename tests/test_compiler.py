@@ -0,0 +1,170 @@
+import pytest
+import uuid
+
+from solvent import graph, mapping, modeling
+from solvent.mapping import compiler, incremental, interpreter
+
+
+@pytest.fixture
+def node():
+    return graph.Node(id=uuid.uuid4(), value=True, size=3)
+
+
+@pytest.fixture
+def connection():
+    source = graph.Node(id=uuid.uuid4(), value=False)
+    destinations = [graph.Node(id=uuid.uuid4(), value=True) for _ in range(3)]
+
+    return graph.Connection(
+        id=uuid.uuid4(), type="mandatory", source=source, destinations=destinations
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "Equivalence(true, false)",
+        "Negation(Node.value)",
+        "And(Node.value, Or(true, Node.value))",
+        "Integer(Range(0, 10))",
+        "Inferior(Node.size, Addition(Node.size, 1))",
+        "Maximum(Node.size, Minimum(2, 3))",
+    ],
+)
+def test_compile_matches_interpreter_for_nodes(code, node, structure):
+    tree = mapping.parse(code)
+
+    assert structure(compiler.compile(tree)(node)) == structure(tree.to_model(node))
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "Implication(Connection.source.value, Connection.destination.value)",
+        "And(Connection.destinations.value)",
+        "Or(true, Connection.destinations.value, false)",
+    ],
+)
+def test_compile_matches_interpreter_for_connections(code, connection, structure):
+    tree = mapping.parse(code)
+
+    assert structure(compiler.compile(tree)(connection)) == structure(
+        tree.to_model(connection)
+    )
+
+
+def test_compile_literals_build_fresh_models(node):
+    rule = mapping.compile_rule("And(true, false)")
+
+    first, second = rule(node), rule(node)
+
+    assert isinstance(first, modeling.And)
+    assert first is not second
+    assert list(first.parameters) == [False, True]
+
+
+def test_compile_unknown_type():
+    with pytest.raises(ValueError):
+        compiler.compile(interpreter.Logic("Nand", [True, False]))
+
+
+def test_compile_value_type_check(connection):
+    rule = mapping.compile_rule("Negation(Node.value)")
+
+    with pytest.raises(TypeError):
+        rule(connection)
+
+
+def test_value_fan_out(connection):
+    model = mapping.compile_rule("And(Connection.destinations.value)")(connection)
+
+    assert list(model.parameters) == [True, True, True]
+
+
+def test_value_fan_out_compact(connection):
+    compact = graph.MGraph.from_components(
+        [connection.source] + connection.destinations, [connection], compact=True
+    ).get_connection(connection.id)
+
+    model = mapping.compile_rule("Or(false, Connection.destinations.value)")(compact)
+
+    assert list(model.parameters) == [False, True, True, True]
+
+
+def test_value_nested_dictionaries():
+    node = graph.Node(id=uuid.uuid4(), data={"limits": {"maximum": 7}})
+
+    assert (
+        interpreter.Value("Node", ["data", "limits", "maximum"], None).to_model(node)
+        == 7
+    )
+
+
+def test_value_nested_fan_out():
+    destinations = [
+        graph.Node(id=uuid.uuid4(), properties=[{"value": 1}, {"value": 2}]),
+        graph.Node(id=uuid.uuid4(), properties=[{"value": 3}]),
+    ]
+    connection = graph.Connection(
+        id=uuid.uuid4(), source=destinations[0], destinations=destinations
+    )
+    path = ("Connection", ("destinations", "properties", "value"))
+
+    assert interpreter.accessor(*path)(connection) == [1, 2, 3]
+    assert incremental.reads(path, connection) == {
+        (connection.id, "destinations"),
+        (destinations[0].id, "properties"),
+        (destinations[1].id, "properties"),
+    }
+
+
+def test_value_memo_shared_across_references():
+    class Counting(dict):
+        calls = 0
+
+        def get(self, key, default=None):
+            Counting.calls += 1
+            return super().get(key, default)
+
+    node = graph.Node(id=uuid.uuid4(), data=Counting(value=True))
+    rule = mapping.compile_rule(
+        "Equivalence(Node.data.value, Negation(Node.data.value))"
+    )
+
+    model = rule(node)
+
+    assert Counting.calls == 1
+    assert model.parameters[0] is True
+    assert model.parameters[1].parameters[0] is True
+
+    rule(node)
+
+    assert Counting.calls == 2
+
+
+def test_compile_with_factory_shares_models():
+    factory = modeling.Factory()
+    rule = mapping.compile_rule(
+        "Implication(Connection.source.value, Negation(true))", factory
+    )
+    source = graph.Node(id=uuid.uuid4(), value=True)
+    connections = [
+        graph.Connection(
+            id=uuid.uuid4(), source=source, destinations=[graph.Node(id=uuid.uuid4())]
+        )
+        for _ in range(3)
+    ]
+
+    models = [rule(connection) for connection in connections]
+
+    assert models[0] is models[1] is models[2]
+    assert isinstance(models[0].parameters[1], modeling.Negation)
+
+
+def test_compile_simplify(node):
+    rule = mapping.compile_rule(
+        "And(true, Node.value, Inferior(Addition(1, 2), 4, Inclusive))", simplify=True
+    )
+
+    assert rule(node) is True
+    assert rule(graph.Node(id=uuid.uuid4(), value=False)) is False
@@ -1,9 +1,12 @@
+import array
+import copy
+import pickle
 import pytest
 import uuid
 
 from textx import metamodel_from_file
 from solvent.mapping import interpreter
-from solvent import graph
+from solvent import adjacency, graph
 
 
 @pytest.fixture
@@ -207,3 +210,437 @@ def test_get_connections_from_destination(feature_model):
     )
 
     assert len(connections) == 2
+
+
+def test_from_components(feature_model):
+    graph_copy = graph.MGraph.from_components(
+        feature_model.nodes, feature_model.connections
+    )
+
+    assert len(graph_copy.nodes) == len(feature_model.nodes)
+    assert len(graph_copy.connections) == len(feature_model.connections)
+    assert (
+        len(
+            graph_copy.get_connections_from_source(
+                uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58")
+            )
+        )
+        == 4
+    )
+
+
+def test_from_components_deduplicates_connections():
+    source = graph.Node(id=uuid.uuid4())
+    destination = graph.Node(id=uuid.uuid4())
+    connection = graph.Connection(
+        id=uuid.uuid4(), source=source, destinations=[destination]
+    )
+    connections = [connection, connection]
+
+    feature_model = graph.MGraph.from_components([source, destination], connections)
+
+    assert len(connections) == 2
+    assert len(feature_model.connections) == 1
+    assert len(feature_model.get_connections_from_source(source.id)) == 1
+    assert len(feature_model.get_connections_from_destination(destination.id)) == 1
+
+
+def test_add_connection_deduplicates():
+    source = graph.Node(id=uuid.uuid4())
+    destination = graph.Node(id=uuid.uuid4())
+    connection = graph.Connection(
+        id=uuid.uuid4(), source=source, destinations=[destination]
+    )
+
+    feature_model = graph.MGraph(nodes=[source, destination])
+    feature_model.add_connection(connection)
+    feature_model.add_connection(connection)
+
+    assert len(feature_model.connections) == 1
+    assert len(feature_model.get_connections_from_source(source.id)) == 1
+
+
+def test_compact_node():
+    node = graph.CompactNode(id=uuid.uuid4(), name="Calls", value=True)
+    other = graph.CompactNode(id=uuid.uuid4(), name="GPS", value=False)
+
+    assert node.name == "Calls"
+    assert node.parameters == {"id": node.id, "name": "Calls", "value": True}
+    assert node._schema is other._schema
+
+
+def test_compact_connection():
+    source = graph.CompactNode(id=uuid.uuid4(), name="Mobile Phone")
+    destination = graph.CompactNode(id=uuid.uuid4(), name="GPS")
+    connection = graph.CompactConnection(
+        id=uuid.uuid4(), type="optional", source=source, destinations=[destination]
+    )
+
+    assert connection.type == "optional"
+    assert connection.destination is destination
+    assert connection.parameters["destination"] is destination
+
+
+@pytest.mark.parametrize(
+    "node", [graph.Node, graph.CompactNode], ids=["plain", "compact"]
+)
+@pytest.mark.parametrize(
+    "connection",
+    [graph.Connection, graph.CompactConnection],
+    ids=["plain", "compact"],
+)
+def test_missing_attributes(node, connection):
+    source = node(id=uuid.uuid4(), _private=1)
+    edge = connection(id=uuid.uuid4(), source=source, destinations=[source])
+
+    assert source._private == 1
+    assert getattr(source, "missing", None) is None
+    assert not hasattr(edge, "missing")
+    assert edge.destination is source
+
+    for component in (source, edge):
+        restored = pickle.loads(pickle.dumps(component))
+
+        assert restored.parameters.keys() == component.parameters.keys()
+        assert copy.copy(component).id == component.id
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["plain", "compact"])
+def test_get(compact):
+    source = graph.Node(id=uuid.uuid4(), value=None)
+    connection = graph.Connection(
+        id=uuid.uuid4(), type="optional", source=source, destinations=[source]
+    )
+    mgraph = graph.MGraph.from_components([source], [connection], compact=compact)
+    source, connection = mgraph.nodes[0], mgraph.connections[0]
+
+    assert source.get("value", 1) is None
+    assert source.get("missing") is None
+    assert source.get("missing", 1) == 1
+    assert connection.get("type") == "optional"
+    assert connection.get("destination") is source
+    assert mgraph.find_nodes(value=None) == [source]
+
+
+def test_from_components_compact(feature_model):
+    compact_model = graph.MGraph.from_components(
+        feature_model.nodes, feature_model.connections, compact=True
+    )
+    node = compact_model.get_node(uuid.UUID("04478096-bae7-4e7f-9c4f-7c08d7eb60af"))
+    connections = compact_model.get_connections_from_source(
+        uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58")
+    )
+
+    assert isinstance(node, graph.CompactNode)
+    assert node.name == "Color"
+    assert len(connections) == 4
+    assert all(
+        isinstance(connection, graph.CompactConnection) for connection in connections
+    )
+    assert connections[0].source is compact_model.get_node(connections[0].source.id)
+
+
+def test_csr_numpy_matches_arrays(monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    rows = array.array("q", [2, 0, 2, 1, 0])
+    columns = array.array("q", [5, 6, 7, 8, 9])
+    vectorized = adjacency.CSR.from_pairs(4, rows, columns)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(adjacency, "numpy", None)
+        plain = adjacency.CSR.from_pairs(4, rows, columns)
+        expected = [
+            (plain.row(index).tolist(), plain.degree(index)) for index in range(6)
+        ]
+
+    assert isinstance(vectorized.offsets, numpy.ndarray)
+    assert vectorized.offsets.tolist() == list(plain._offsets)
+    assert vectorized.columns.tolist() == list(plain._columns)
+    assert [
+        (vectorized.row(index).tolist(), vectorized.degree(index)) for index in range(6)
+    ] == expected
+
+
+def test_adjacency_sources(feature_model):
+    adjacency = feature_model.adjacency()
+    index = feature_model.node_index(uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58"))
+    connections = [
+        feature_model.get_connection(feature_model.connection_id(connection))
+        for connection in adjacency.sources.row(index)
+    ]
+
+    assert connections == feature_model.get_connections_from_source(
+        uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58")
+    )
+    assert len(adjacency.sources.offsets) == len(feature_model.nodes) + 1
+
+
+def test_adjacency_destinations(feature_model):
+    adjacency = feature_model.adjacency()
+    index = feature_model.node_index(uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e"))
+    sources = {
+        feature_model.node_id(source) for source in adjacency.predecessors(index)
+    }
+
+    assert adjacency.destinations.degree(index) == 2
+    assert sources == {
+        uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58"),
+        uuid.UUID("54d38b28-965a-4251-8711-ac8515303288"),
+    }
+
+
+def test_adjacency_invalidated_on_mutation(feature_model):
+    adjacency = feature_model.adjacency()
+    node = graph.Node(id=uuid.uuid4())
+
+    assert feature_model.adjacency() is adjacency
+
+    feature_model.add_node(node)
+    feature_model.add_connection(
+        graph.Connection(
+            id=uuid.uuid4(),
+            source=node,
+            destinations=[
+                feature_model.get_node(
+                    uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58")
+                )
+            ],
+        )
+    )
+
+    assert feature_model.adjacency() is not adjacency
+    assert list(
+        feature_model.adjacency().successors(feature_model.node_index(node.id))
+    ) == [feature_model.node_index(uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58"))]
+
+
+def test_remove_connection(feature_model):
+    feature_model.remove_connection(uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725"))
+
+    assert (
+        feature_model.get_connection(uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725"))
+        is None
+    )
+    assert (
+        feature_model.get_connections_from_source(
+            uuid.UUID("54d38b28-965a-4251-8711-ac8515303288")
+        )
+        is None
+    )
+    assert (
+        len(
+            feature_model.get_connections_from_destination(
+                uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e")
+            )
+        )
+        == 1
+    )
+
+
+def test_remove_node(feature_model):
+    version = feature_model.version
+
+    feature_model.remove_node(uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e"))
+
+    assert feature_model.version > version
+    assert (
+        feature_model.get_node(uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e"))
+        is None
+    )
+    assert (
+        feature_model.node_index(uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e"))
+        is None
+    )
+    assert (
+        len(
+            feature_model.get_connections_from_source(
+                uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58")
+            )
+        )
+        == 3
+    )
+    assert (
+        feature_model.get_connection(uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725"))
+        is None
+    )
+
+
+def test_remove_node_shrinks_destinations():
+    nodes = [graph.Node(id=uuid.uuid4()) for _ in range(3)]
+    connection = graph.Connection(
+        id=uuid.uuid4(), type="or", source=nodes[0], destinations=nodes[1:]
+    )
+    mgraph = graph.MGraph.from_components(nodes, [connection])
+    events = []
+    mgraph.subscribe(lambda event, old, new: events.append(event))
+
+    mgraph.remove_node(nodes[1].id)
+
+    assert [
+        destination.id
+        for destination in mgraph.get_connection(connection.id).destinations
+    ] == [nodes[2].id]
+    assert mgraph.get_connections_from_destination(nodes[1].id) is None
+    assert events == ["retarget_connection", "remove_node"]
+
+    mgraph.remove_node(nodes[2].id)
+
+    assert mgraph.get_connection(connection.id) is None
+    assert mgraph.get_connections_from_source(nodes[0].id) is None
+
+
+def test_remove_missing_node(feature_model):
+    with pytest.raises(ValueError):
+        feature_model.remove_node(uuid.uuid4())
+
+
+def test_update_node(feature_model):
+    node = feature_model.update_node(
+        uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e"), Selected=True
+    )
+    connections = feature_model.get_connections_from_destination(
+        uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e")
+    )
+
+    assert node.name == "GPS"
+    assert node.Selected is True
+    assert feature_model.get_node(node.id) is node
+    assert all(connection.destination is node for connection in connections)
+    assert [connection.type for connection in connections] == ["optional", "excludes"]
+
+
+def test_retarget_connection(feature_model):
+    connection = feature_model.retarget_connection(
+        uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725"),
+        destinations=[uuid.UUID("1f40d88b-96c3-46f8-9644-405f1c37a607")],
+    )
+
+    assert connection.destination.name == "Camera"
+    assert (
+        len(
+            feature_model.get_connections_from_destination(
+                uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e")
+            )
+        )
+        == 1
+    )
+    assert feature_model.get_connections_from_destination(
+        uuid.UUID("1f40d88b-96c3-46f8-9644-405f1c37a607")
+    ) == [connection]
+
+
+def test_adjacency_after_removal(feature_model):
+    feature_model.remove_connection(uuid.UUID("50f87a4f-2cfc-4c91-bc80-b0898e98df72"))
+    adjacency = feature_model.adjacency()
+    index = feature_model.node_index(uuid.UUID("897411a9-f316-4f19-a321-10d111dcad58"))
+
+    assert adjacency.sources.degree(index) == 3
+
+
+def test_find_connections_from_index(feature_model):
+    feature_model.create_index("type")
+    connections = feature_model.find_connections(type="optional")
+
+    assert len(connections) == 3
+    assert all(connection.type == "optional" for connection in connections)
+    assert feature_model.find_connections(type="requires") == []
+
+
+def test_find_connections_without_index(feature_model):
+    connections = feature_model.find_connections(type="excludes")
+
+    assert [connection.id for connection in connections] == [
+        uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725")
+    ]
+
+
+def test_find_nodes(feature_model):
+    feature_model.create_index("name")
+    nodes = feature_model.find_nodes(
+        name="GPS", id=uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e")
+    )
+
+    assert [node.name for node in nodes] == ["GPS"]
+
+
+def test_index_maintained_on_mutation(feature_model):
+    feature_model.create_index("type")
+    feature_model.create_index("Selected")
+
+    feature_model.remove_connection(uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725"))
+    feature_model.update_node(
+        uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e"), Selected=True
+    )
+
+    assert feature_model.find_connections(type="excludes") == []
+    assert [node.name for node in feature_model.find_nodes(Selected=True)] == ["GPS"]
+    assert all(
+        connection is feature_model.get_connection(connection.id)
+        for connection in feature_model.find_connections(type="optional")
+    )
+
+
+def test_index_skips_unhashable_values(feature_model):
+    feature_model.add_node(
+        graph.Node(id=uuid.uuid4(), name="Wifi", properties={"band": 5})
+    )
+    feature_model.create_index("tags")
+    feature_model.create_index("properties")
+
+    tagged = graph.Node(id=uuid.uuid4(), name="Camera", tags=["media", "optional"])
+    feature_model.add_node(tagged)
+    feature_model.add_node(graph.Node(id=uuid.uuid4(), name="Radio", tags="media"))
+    feature_model.update_node(tagged.id, tags=["media"])
+
+    assert [node.name for node in feature_model.find_nodes(tags=["media"])] == [
+        "Camera"
+    ]
+    assert [node.name for node in feature_model.find_nodes(tags="media")] == ["Radio"]
+    assert feature_model.find_nodes(properties={}) == []
+    assert [node.name for node in feature_model.find_nodes(properties={"band": 5})] == [
+        "Wifi"
+    ]
+
+
+def test_snapshot_isolated_from_writer(feature_model):
+    snapshot = feature_model.snapshot()
+    gps = uuid.UUID("cbb3cbb5-69bd-4077-b341-e8b02c67581e")
+
+    feature_model.update_node(gps, Selected=True)
+    feature_model.remove_connection(uuid.UUID("6cfe4e49-4d5b-43be-b239-39335afbf725"))
+    feature_model.add_node(graph.Node(id=uuid.uuid4(), name="Camera"))
+
+    assert "Selected" not in snapshot.get_node(gps).parameters
+    assert len(snapshot.get_connections_from_destination(gps)) == 2
+    assert len(snapshot.nodes) == len(feature_model.nodes) - 1
+    assert feature_model.get_node(gps).Selected is True
+    assert len(feature_model.get_connections_from_destination(gps)) == 1
+
+
+def test_snapshot_is_read_only(feature_model):
+    snapshot = feature_model.snapshot()
+
+    assert snapshot.frozen
+    assert snapshot.snapshot() is snapshot
+
+    with pytest.raises(TypeError):
+        snapshot.add_node(graph.Node(id=uuid.uuid4()))
+
+
+def test_snapshot_reused_until_write(feature_model):
+    snapshot = feature_model.snapshot()
+
+    assert feature_model.snapshot() is snapshot
+
+    feature_model.add_node(graph.Node(id=uuid.uuid4()))
+
+    assert feature_model.snapshot() is not snapshot
+
+
+def test_snapshot_released_without_copy(feature_model):
+    node_table = feature_model._node_table
+    feature_model.snapshot()
+
+    feature_model.add_node(graph.Node(id=uuid.uuid4()))
+
+    assert feature_model._node_table is node_table
@@ -0,0 +1,130 @@
+import pytest
+import uuid
+
+from solvent import graph, hashing
+
+
+@pytest.fixture
+def components():
+    nodes = [
+        graph.Node(id=uuid.uuid4(), name=name)
+        for name in ["Mobile Phone", "Calls", "GPS", "Screen", "Basic", "Color"]
+    ]
+    phone, calls, gps, screen, basic, color = nodes
+
+    connections = [
+        graph.Connection(
+            id=uuid.uuid4(), type="mandatory", source=phone, destinations=[calls]
+        ),
+        graph.Connection(
+            id=uuid.uuid4(), type="optional", source=phone, destinations=[gps]
+        ),
+        graph.Connection(
+            id=uuid.uuid4(), type="mandatory", source=phone, destinations=[screen]
+        ),
+        graph.Connection(
+            id=uuid.uuid4(), type="or", source=screen, destinations=[basic, color]
+        ),
+        graph.Connection(
+            id=uuid.uuid4(), type="excludes", source=basic, destinations=[gps]
+        ),
+    ]
+
+    return nodes, connections
+
+
+def test_hashes_are_structural(components):
+    nodes, connections = components
+    first = graph.MGraph.from_components(nodes, connections)
+    second = graph.MGraph.from_components(reversed(nodes), reversed(connections))
+
+    assert first.root_hash() == second.root_hash()
+    assert first.subtree_hash(nodes[0].id) == second.subtree_hash(nodes[0].id)
+    assert not first.diff(second)
+
+
+def test_subtree_hash_invalidated_upwards(components):
+    nodes, connections = components
+    feature_model = graph.MGraph.from_components(nodes, connections)
+    phone, calls, gps, screen, basic, color = (node.id for node in nodes)
+
+    root = feature_model.subtree_hash(phone)
+    screen_hash = feature_model.subtree_hash(screen)
+    calls_hash = feature_model.subtree_hash(calls)
+
+    feature_model.update_node(color, Selected=True)
+
+    assert feature_model.subtree_hash(calls) == calls_hash
+    assert feature_model.subtree_hash(screen) != screen_hash
+    assert feature_model.subtree_hash(phone) != root
+
+
+def test_diff_reports_changes(components):
+    nodes, connections = components
+    old = graph.MGraph.from_components(nodes, connections)
+    new = graph.MGraph.from_components(nodes, connections)
+    phone, calls, gps, screen, basic, color = (node.id for node in nodes)
+    camera = graph.Node(id=uuid.uuid4(), name="Camera")
+
+    new.update_node(color, Selected=True)
+    new.remove_connection(connections[4].id)
+    new.add_node(camera)
+    new.add_connection(
+        graph.Connection(
+            id=uuid.uuid4(),
+            type="optional",
+            source=new.get_node(phone),
+            destinations=[camera],
+        )
+    )
+
+    diff = old.diff(new)
+
+    assert diff.changed_nodes == [color]
+    assert diff.added_nodes == [camera.id]
+    assert diff.removed_nodes == []
+    assert diff.removed_connections == [connections[4].id]
+    assert len(diff.added_connections) == 1
+    assert diff.changed_connections == []
+
+
+def test_diff_retargeted_connection(components):
+    nodes, connections = components
+    old = graph.MGraph.from_components(nodes, connections)
+    new = graph.MGraph.from_components(nodes, connections)
+
+    new.retarget_connection(connections[1].id, source=nodes[3].id)
+
+    diff = old.diff(new)
+
+    assert diff.changed_connections == [connections[1].id]
+    assert not diff.added_connections and not diff.removed_connections
+    assert not diff.changed_nodes
+
+
+def test_sets_hash_by_content():
+    first = graph.MGraph.from_components([graph.Node(id=uuid.uuid4(), tags={8, 0})], [])
+    second = graph.MGraph.from_components(
+        [graph.Node(id=first.nodes[0].id, tags={0, 8})], []
+    )
+
+    assert list(first.nodes[0].tags) != list(second.nodes[0].tags)
+    assert hashing.encode(frozenset([8, 0])) == hashing.encode({0, 8})
+    assert not first.diff(second)
+
+
+def test_cycle_over_non_uuid_ids():
+    first, second = graph.Node(id="first"), graph.Node(id="second")
+    mgraph = graph.MGraph.from_components(
+        [first, second],
+        [
+            graph.Connection(
+                id=uuid.uuid4(), type="mandatory", source=first, destinations=[second]
+            ),
+            graph.Connection(
+                id=uuid.uuid4(), type="mandatory", source=second, destinations=[first]
+            ),
+        ],
+    )
+
+    assert mgraph.subtree_hash("first") != mgraph.subtree_hash("second")
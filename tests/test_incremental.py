@@ -0,0 +1,155 @@
+import pytest
+import uuid
+
+from solvent import graph, modeling
+from solvent.mapping import incremental, registry
+
+
+@pytest.fixture
+def mapper(mgraph):
+    rules = registry.Registry()
+    rules.register("Node", "Boolean(Node.value)")
+    rules.register(
+        "Connection:mandatory",
+        "Equivalence(Connection.source.value, Connection.destination.value)",
+    )
+    rules.register(
+        "Connection:or",
+        "Implication(Connection.source.value, Or(Connection.destinations.value))",
+    )
+
+    mapper = incremental.Mapper(mgraph, rules)
+    mapper.deltas = []
+    mapper.subscribe(mapper.deltas.append)
+
+    return mapper
+
+
+def test_reads():
+    source = graph.Node(id=uuid.uuid4(), value=True, data={"size": 1})
+    destinations = [graph.Node(id=uuid.uuid4()) for _ in range(2)]
+    connection = graph.Connection(
+        id=uuid.uuid4(), source=source, destinations=destinations
+    )
+
+    assert incremental.reads(
+        ("Connection", ("source", "data", "size")), connection
+    ) == {
+        (connection.id, "source"),
+        (source.id, "data"),
+    }
+    assert incremental.reads(("Connection", ("destinations", "value")), connection) == {
+        (connection.id, "destinations"),
+    } | {(destination.id, "value") for destination in destinations}
+
+
+def test_initial_mapping(mapper, mgraph):
+    assert len(mapper) == 7
+    assert {id for id, _ in mapper.constraints()} == {
+        component.id
+        for component in mgraph.nodes
+        + mgraph.find_connections(type="mandatory")
+        + mgraph.find_connections(type="or")
+    }
+
+
+def test_update_node_remaps_only_readers(mapper, mgraph):
+    connection = mgraph.find_connections(type="or")[0]
+    child = connection.destinations[0]
+
+    assert mapper.readers(child.id, "value") == {child.id, connection.id}
+
+    mgraph.update_node(child.id, value=False)
+
+    (delta,) = mapper.deltas
+
+    assert [id for id, _ in delta.removed] == [id for id, _ in delta.added]
+    assert {id for id, _ in delta.added} == {child.id, connection.id}
+
+    implication = dict(mapper.constraints())[connection.id]
+
+    assert implication.parameters[1].parameters == (False, False)
+
+
+def test_update_unrelated_attribute(mapper, mgraph):
+    root = mgraph.connections[0].source
+
+    mgraph.update_node(root.id, name="Root")
+
+    assert mapper.deltas == []
+    assert len(mapper) == 7
+
+
+def test_add_and_remove(mapper, mgraph):
+    node = graph.Node(id=uuid.uuid4(), value=False)
+    mgraph.add_node(node)
+
+    assert [id for id, _ in mapper.deltas[-1].added] == [node.id]
+    assert mapper.deltas[-1].removed == []
+
+    root = mgraph.connections[0].source
+    mgraph.remove_node(root.id)
+
+    removed = [id for delta in mapper.deltas[1:] for id, _ in delta.removed]
+
+    assert (
+        set(removed)
+        == {root.id} | {connection.id for connection in mapper.graph.connections}
+        or len(removed) == 3
+    )
+    assert len(mapper) == 5
+
+
+def test_retarget_connection(mapper, mgraph):
+    connection = mgraph.find_connections(type="mandatory")[0]
+    other = mgraph.find_connections(type="or")[0].destinations[0]
+    mgraph.update_node(other.id, value=False)
+    mapper.deltas.clear()
+
+    mgraph.retarget_connection(connection.id, destinations=[other.id])
+
+    (delta,) = mapper.deltas
+
+    assert [id for id, _ in delta.added] == [connection.id]
+    assert mapper.readers(other.id, "value") >= {connection.id}
+
+
+def test_type_change_redispatches(mapper, mgraph):
+    node = mgraph.nodes[1]
+    rules = mapper.registry
+    rules.register("Node:leaf", "Negation(Node.value)")
+
+    mgraph.update_node(node.id, type="leaf")
+
+    (delta,) = mapper.deltas
+
+    assert [type(model) for _, model in delta.added] == [modeling.Negation]
+    assert delta.removed == []
+
+
+def test_close(mapper, mgraph):
+    mapper.close()
+    mgraph.add_node(graph.Node(id=uuid.uuid4(), value=True))
+
+    assert mapper.deltas == []
+
+
+def test_graph_notifications(mgraph):
+    events = []
+    mgraph.subscribe(lambda event, old, new: events.append(event))
+
+    node = graph.Node(id=uuid.uuid4())
+    mgraph.add_node(node)
+    mgraph.add_node(node)
+    mgraph.update_node(node.id, value=1)
+    mgraph.remove_node(mgraph.connections[0].source.id)
+
+    assert events == [
+        "add_node",
+        "update_node",
+        "remove_connection",
+        "remove_connection",
+        "remove_connection",
+        "remove_connection",
+        "remove_node",
+    ]
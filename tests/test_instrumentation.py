@@ -0,0 +1,117 @@
+import pytest
+import uuid
+
+from solvent import graph, mapping
+from solvent.mapping import instrumentation
+
+
+CODE = "Implication(Connection.source.value, Connection.destination.value)"
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+
+    yield
+
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+@pytest.fixture
+def connection():
+    return graph.Connection(
+        id=uuid.uuid4(),
+        source=graph.Node(id=uuid.uuid4(), value=True),
+        destinations=[graph.Node(id=uuid.uuid4(), value=False)],
+    )
+
+
+def test_histogram():
+    histogram = instrumentation.Histogram()
+
+    for duration in (5e-7, 2e-5, 2e-5, 3.0):
+        histogram.record(duration)
+
+    assert histogram.count == 4
+    assert histogram.minimum == 5e-7
+    assert histogram.maximum == 3.0
+    assert histogram.mean == pytest.approx((5e-7 + 4e-5 + 3.0) / 4)
+    assert histogram.buckets == [1, 0, 2, 0, 0, 0, 0, 1]
+
+
+def test_disabled_records_nothing(connection):
+    rule = mapping.compile_rule(CODE)
+    rule(connection)
+
+    assert instrumentation.statistics() == {}
+
+
+def test_stage_counters(instrumented, connection):
+    rule = mapping.compile_rule(CODE)
+
+    for _ in range(3):
+        rule(connection)
+
+    statistics = instrumentation.statistics()
+
+    assert statistics[("parse", CODE)].count == 1
+    assert statistics[("check", CODE)].count == 1
+    assert statistics[("compile", CODE)].count == 1
+    assert statistics[("evaluate", CODE)].count == 3
+    assert statistics[("resolve", CODE)].count == 6
+    assert statistics[("evaluate", CODE)].total > 0
+
+
+def test_hooks(instrumented, connection):
+    spans = []
+
+    def hook(stage, rule, start, end):
+        spans.append((stage, rule, end >= start))
+
+    instrumentation.add_hook(hook)
+
+    try:
+        mapping.compile_rule(CODE, check=False)(connection)
+    finally:
+        instrumentation.remove_hook(hook)
+
+    assert [span[0] for span in spans] == [
+        "parse",
+        "compile",
+        "resolve",
+        "resolve",
+        "evaluate",
+    ]
+    assert all(span[1] == CODE and span[2] for span in spans)
+
+
+def test_errors_are_recorded(instrumented):
+    rule = mapping.compile_rule("Negation(Node.value)")
+
+    with pytest.raises(TypeError):
+        rule(graph.Node(id=uuid.uuid4(), value=1))
+
+    assert instrumentation.statistics()[("evaluate", "Negation(Node.value)")].count == 1
+
+
+def test_toggled_after_compile(connection):
+    rule = mapping.compile_rule(CODE)
+
+    instrumentation.reset()
+    instrumentation.enable()
+
+    try:
+        rule(connection)
+        rule(connection)
+    finally:
+        instrumentation.disable()
+
+    assert instrumentation.statistics()[("evaluate", CODE)].count == 2
+
+    rule(connection)
+
+    assert instrumentation.statistics()[("evaluate", CODE)].count == 2
+
+    instrumentation.reset()
@@ -1,24 +1,12 @@
 import pytest
 import uuid
 
-from textx import metamodel_from_file
-from solvent.mapping import interpreter
-from solvent import modeling, graph
+from solvent import mapping, modeling, graph
 
 
 @pytest.fixture
 def meta_model():
-    return metamodel_from_file(
-        "./solvent/mapping/mapping.tx",
-        classes=[
-            interpreter.Logic,
-            interpreter.Relational,
-            interpreter.Arithmetic,
-            interpreter.Variable,
-            interpreter.Range,
-            interpreter.Value,
-        ],
-    )
+    return mapping.get_metamodel()
 
 
 def test_equivalence_static_parameters(meta_model):
@@ -935,3 +923,16 @@ def test_boolean(meta_model):
 
     assert isinstance(model, modeling.Boolean)
     assert isinstance(model.parameters[0], uuid.UUID)
+
+
+def test_metamodel_built_once():
+    assert mapping.get_metamodel() is mapping.get_metamodel()
+
+
+def test_metamodel_independent_of_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(mapping, "_metamodel", None)
+
+    model = mapping.get_metamodel().model_from_str("Negation(true)")
+
+    assert isinstance(model.to_model(graph.Node(id=uuid.uuid4())), modeling.Negation)
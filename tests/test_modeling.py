@@ -0,0 +1,224 @@
+import gc
+import pickle
+import pytest
+
+from solvent import modeling
+
+
+@pytest.fixture
+def factory():
+    return modeling.Factory()
+
+
+def test_factory_shares_identical_subexpressions(factory):
+    first = factory.make(modeling.Negation, True)
+    second = factory.make(modeling.Negation, True)
+
+    assert first is second
+    conjunction = factory.make(modeling.And, first, False)
+
+    assert factory.make(modeling.And, second, False) is conjunction
+    assert len(factory) == 2
+
+
+def test_factory_distinguishes_literal_types(factory):
+    assert factory.make(modeling.Integer, 1) is not factory.make(modeling.Integer, True)
+    assert factory.make(modeling.Inferior, 1, 2) is not factory.make(
+        modeling.Inferior, 2, 1
+    )
+
+
+def test_factory_unhashable_parameters(factory):
+    first = factory.make(modeling.And, [True])
+    second = factory.make(modeling.And, [True])
+
+    assert first is not second
+    assert len(factory) == 0
+
+
+def test_factory_intern_builds_dag(factory):
+    tree = modeling.And(
+        modeling.Negation(True),
+        modeling.Or(modeling.Negation(True), modeling.Integer(modeling.Range(0, 3))),
+    )
+
+    dag = factory.intern(tree)
+
+    assert dag is not tree
+    assert dag.parameters[0] is dag.parameters[1].parameters[1]
+    assert factory.intern(tree) is dag
+    assert factory.intern(dag) is dag
+    assert factory.intern(True) is True
+
+
+def shared(depth):
+    model = modeling.Boolean("x")
+
+    for _ in range(depth):
+        model = modeling.Implication(model, modeling.Negation(model))
+
+    return model
+
+
+def test_factory_intern_shared_dag(factory):
+    dag = factory.intern(shared(40))
+
+    assert len(factory) == 81
+    assert dag.parameters[0] is dag.parameters[1].parameters[0]
+    assert factory.intern(dag) is dag
+
+
+def test_factory_releases_unused_models(factory):
+    factory.make(modeling.Negation, factory.make(modeling.Negation, False))
+    gc.collect()
+
+    assert len(factory) == 0
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        (modeling.Addition(1, 2, 3), 6),
+        (modeling.Subtraction(10, 2, 3), 5),
+        (modeling.Multiplication(2, modeling.Addition(1, 2)), 6),
+        (modeling.Division(12, 4), 3),
+        (modeling.Minimum(4, 2, 9), 2),
+        (modeling.Maximum(4, 2, 9), 9),
+        (modeling.Equal(3, 3), True),
+        (modeling.Different(3, 3), False),
+        (modeling.Inferior(2, 2, "Inclusive"), True),
+        (modeling.Superior(2, 2, "Exclusive"), False),
+        (modeling.Negation(False), True),
+        (modeling.And(True, modeling.Negation(True)), False),
+        (modeling.Or(False, modeling.Equal(1, 1)), True),
+        (modeling.And(True, True), True),
+        (modeling.Or(False), False),
+        (modeling.Equivalence(True, True), True),
+        (modeling.Xor(True, True), False),
+        (modeling.Implication(False, "x"), True),
+    ],
+)
+def test_simplify_constants(model, expected):
+    result = modeling.simplify(model)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_simplify_keeps_unfoldable(structure):
+    for model in [
+        modeling.Division(7, 2),
+        modeling.Division(7, 0),
+        modeling.Inferior(1, 2),
+        modeling.Equal(1, 2, 3),
+        modeling.Xor(True, False, True),
+        modeling.Integer(modeling.Range(0, 3)),
+    ]:
+        assert structure(modeling.simplify(model)) == structure(model)
+
+
+def test_simplify_boolean_identities(structure):
+    x, y = modeling.Boolean("x"), modeling.Boolean("y")
+
+    assert modeling.simplify(modeling.And(True, x)) is x
+    assert modeling.simplify(modeling.Or(False, x)) is x
+    assert modeling.simplify(modeling.Negation(modeling.Negation(x))) is x
+    assert modeling.simplify(modeling.Equivalence(True, x)) is x
+    assert modeling.simplify(modeling.Implication(True, x)) is x
+    assert structure(modeling.simplify(modeling.Xor(x, True))) == structure(
+        modeling.Negation(x)
+    )
+    assert structure(modeling.simplify(modeling.Implication(x, False))) == structure(
+        modeling.Negation(x)
+    )
+    assert structure(
+        modeling.simplify(modeling.Equivalence(False, modeling.Negation(x)))
+    ) == structure(x)
+
+
+def test_simplify_flattens():
+    x, y, z = (modeling.Boolean(name) for name in "xyz")
+    model = modeling.And(x, modeling.And(y, modeling.And(True, z)), modeling.Or(x, y))
+
+    result = modeling.simplify(model)
+
+    assert isinstance(result, modeling.And)
+    assert list(result.parameters[:3]) == [x, y, z]
+    assert isinstance(result.parameters[3], modeling.Or)
+
+
+def test_simplify_keeps_unchanged_conjunctions():
+    x, y = modeling.Boolean("x"), modeling.Boolean("y")
+    conjunction = modeling.And(x, modeling.Or(x, y))
+    nested = modeling.And(x, modeling.And(y))
+
+    assert modeling.simplify(conjunction) is conjunction
+    assert modeling.simplify(nested) is not nested
+    assert list(modeling.simplify(nested).parameters) == [x, y]
+
+
+def test_simplify_with_factory(factory):
+    x = factory.make(modeling.Boolean, "x")
+    model = modeling.And(modeling.Or(x, False, x), modeling.Or(False, x, x))
+
+    result = modeling.simplify(model, factory)
+
+    assert result.parameters[0] is result.parameters[1]
+    assert modeling.simplify(result, factory) is result
+
+
+def test_simplify_shared_dag_with_factory(factory):
+    dag = factory.intern(shared(40))
+
+    assert modeling.simplify(dag, factory) is dag
+    assert modeling.simplify(shared(40), factory) is dag
+
+
+def test_structural_equality_and_hash():
+    first = modeling.And(modeling.Negation(True), modeling.Equal(1, 2))
+    second = modeling.And(modeling.Negation(True), modeling.Equal(1, 2))
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != modeling.Or(modeling.Negation(True), modeling.Equal(1, 2))
+    assert modeling.Integer(1) != modeling.Integer(True)
+    assert modeling.Negation(True) != True
+    assert len({first, second, modeling.Negation(True)}) == 2
+
+
+def test_canonical_ordering():
+    x, y = modeling.Boolean("x"), modeling.Boolean("y")
+
+    assert modeling.And(y, True, x) == modeling.And(x, y, True)
+    assert modeling.And(y, True, x).parameters == (True, x, y)
+    assert modeling.Addition(3, 1, 2).parameters == (1, 2, 3)
+    assert modeling.Equal(modeling.Addition(2, 1), 4) == modeling.Equal(
+        4, modeling.Addition(1, 2)
+    )
+    assert modeling.Subtraction(3, 1) != modeling.Subtraction(1, 3)
+    assert modeling.Implication(x, y) != modeling.Implication(y, x)
+
+
+def test_hash_is_cached():
+    model = modeling.Or(modeling.Negation(False), False)
+
+    assert model._hash is None
+    assert hash(model) == hash(model)
+    assert model._hash is not None
+
+
+def test_pickle_recomputes_hash():
+    model = modeling.Xor(modeling.Boolean("a"), modeling.Boolean("b"))
+    hash(model)
+
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert restored._hash is None
+    assert restored == model
+    assert hash(restored) == hash(model)
+
+
+def test_linear_deduplication():
+    models = [modeling.Or(modeling.Boolean(index % 3), True) for index in range(30)]
+
+    assert len(dict.fromkeys(models)) == 3
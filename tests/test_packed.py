@@ -0,0 +1,139 @@
+import pickle
+import pytest
+import uuid
+
+from solvent import graph, mapping, modeling, packed
+
+
+@pytest.fixture
+def models():
+    shared = modeling.Negation(True)
+
+    return [
+        modeling.And(shared, modeling.Or(shared, False)),
+        modeling.Integer(modeling.Range(0, 10)),
+        modeling.Inferior(modeling.Addition(1, 2), 4, "Inclusive"),
+        modeling.Equal(1, True),
+        True,
+    ]
+
+
+def test_round_trip(models, structure):
+    data = packed.Packed.from_models(models)
+
+    assert len(data) == 5
+    assert [structure(model) for model in data.models()] == [
+        structure(model) for model in models
+    ]
+    assert structure(data[1]) == structure(models[1])
+
+
+def test_shared_subexpressions(models):
+    data = packed.Packed.from_models(models + models)
+
+    assert data.size == 8
+    assert [type(literal) for literal in data.pool].count(bool) == 2
+    assert len(data.pool) == len({(type(literal), literal) for literal in data.pool})
+
+    decoded = data.models()
+
+    assert decoded[0].parameters[0] is decoded[0].parameters[1].parameters[1]
+    assert decoded[0] is decoded[5]
+
+
+def test_commutative_operands_shared():
+    data = packed.Packed()
+    negation = data.make(modeling.Negation, "a")
+
+    assert (
+        data.make(modeling.And, negation, "b").index
+        == data.make(modeling.And, "b", negation).index
+    )
+    assert (
+        data.make(modeling.Implication, "a", "b").index
+        != data.make(modeling.Implication, "b", "a").index
+    )
+    assert data.size == 4
+
+
+def test_shared_dag_round_trip():
+    model = modeling.Boolean("x")
+
+    for _ in range(40):
+        model = modeling.And(model, modeling.Negation(model))
+
+    data = packed.Packed.from_models([model])
+    again = packed.Packed.from_models(data.models())
+
+    assert data.size == again.size == 81
+    assert hash(again[0]) == hash(model)
+
+
+def test_owners(models):
+    ids = [uuid.uuid4() for _ in models]
+    data = packed.Packed.from_models(models, ids)
+    data.add(modeling.Negation(False))
+
+    assert [data.owner(position) for position in range(len(data))] == ids + [None]
+
+
+def test_export_is_zero_copy(models, structure):
+    data = packed.Packed.from_models(models)
+    buffers = data.export()
+
+    assert buffers["operands"].obj is data.operands
+    assert buffers["roots"].tolist() == list(data.roots)
+
+    view = packed.Packed.from_buffers(**buffers)
+
+    assert not view.writable
+    assert [structure(model) for model in view.models()] == [
+        structure(model) for model in models
+    ]
+
+    with pytest.raises(TypeError):
+        view.add(True)
+
+
+def test_pickle(models, structure):
+    data = packed.Packed.from_models(models)
+
+    for source in (data, packed.Packed.from_buffers(**data.export())):
+        restored = pickle.loads(pickle.dumps(source))
+
+        assert restored.writable
+        assert [structure(model) for model in restored.models()] == [
+            structure(model) for model in models
+        ]
+        assert restored.make(modeling.Negation, True).index == 0
+
+
+def test_pack_rules(structure):
+    source = graph.Node(id=uuid.uuid4(), value=True)
+    children = [graph.Node(id=uuid.uuid4(), value=True) for _ in range(3)]
+    connections = [
+        graph.Connection(
+            id=uuid.uuid4(), type="mandatory", source=source, destinations=[child]
+        )
+        for child in children
+    ]
+    mgraph = graph.MGraph.from_components([source] + children, connections)
+    rules = {
+        "Connection:mandatory": "And(Negation(false), Equivalence(Connection.source.value, Connection.destination.value))"
+    }
+
+    data = mapping.pack_rules(mgraph, rules)
+
+    assert len(data) == 3
+    assert data.size == 3
+    assert [data.owner(position) for position in range(3)] == [
+        connection.id for connection in connections
+    ]
+    assert structure(data[0]) == structure(
+        mapping.compile_rule(rules["Connection:mandatory"])(connections[0])
+    )
+
+    simplified = mapping.pack_rules(mgraph, rules, simplify=True)
+
+    assert simplified.models() == [True, True, True]
+    assert simplified.size == 0
@@ -0,0 +1,173 @@
+import pytest
+import random
+
+from solvent import hashing, mapping
+from solvent.mapping import interpreter, parser
+
+
+VALID = [
+    "Equivalence(true, true)",
+    "And(1, 0)",
+    "Or(True, False, Node.value)",
+    "Negation(Connection.source.value)",
+    "Xor(Connection.destinations.value)",
+    "Implication(Node.value, Inferior(Node.size, 3))",
+    "Inferior(Node.size, 3, Inclusive)",
+    "Superior(Connection.source.size, Addition(1, -2, +3), Exclusive)",
+    "Equal(Maximum(Node.a, Minimum(Node.b, 4)), 10)",
+    "Integer(Range(0, 10))",
+    "Integer(1)",
+    "Addition(1)",
+    "Boolean(true)",
+    "Boolean(1)",
+    "Integer(Node.value)",
+    " \n\tImplication ( Connection . source.value ,\n true ) \n",
+    "Equivalence(Node.data.nested.value, Node._private)",
+]
+
+INVALID = [
+    "",
+    "Equivalence",
+    "Equivalence()",
+    "Equivalence(true,)",
+    "Equivalence(true) extra",
+    "And(10)",
+    "And(truest)",
+    "And(Node)",
+    "And(Node.)",
+    "And(Node.value.)",
+    "And(Nodes.value)",
+    "Integer(Range(0))",
+    "Addition(true)",
+    "Inferior(1, Inclusives)",
+    "Negation(Integer(1))",
+    "Nand(true)",
+    "And(1x)",
+]
+
+
+def textx_parse(code):
+    return mapping.get_metamodel().model_from_str(code)
+
+
+def canonical(tree):
+    return hashing.encode(interpreter.dump(tree))
+
+
+def check_parents(tree, parent):
+    assert tree.parent is parent
+
+    for parameter in getattr(tree, "parameters", []):
+        if isinstance(
+            parameter,
+            (
+                interpreter.Logic,
+                interpreter.Relational,
+                interpreter.Arithmetic,
+                interpreter.Range,
+                interpreter.Value,
+            ),
+        ):
+            check_parents(parameter, tree)
+
+
+def space(generator):
+    return generator.choice(["", " ", "  ", "\n", "\t"])
+
+
+def value(generator):
+    path = ".".join(
+        generator.choice(["value", "size", "source", "destinations", "x1"])
+        for _ in range(generator.randint(1, 3))
+    )
+
+    return f"{generator.choice(['Node', 'Connection'])}.{path}"
+
+
+def operator(generator, kind, depth):
+    types = parser.TYPES[kind]
+    alternatives = parser.PARAMETERS[kind]
+    parameters = []
+
+    for _ in range(generator.randint(1, 3)):
+        alternative = generator.choice(alternatives)
+
+        if isinstance(alternative, type) and depth <= 0:
+            alternative = "Value"
+
+        match alternative:
+            case "BOOL":
+                parameters.append(generator.choice(["true", "false", "True", "0", "1"]))
+            case "INT":
+                parameters.append(str(generator.randint(-50, 50)))
+            case "Inclusiveness":
+                parameters.append(generator.choice(parser.INCLUSIVENESS))
+            case "Value":
+                parameters.append(value(generator))
+            case "Range":
+                parameters.append(
+                    f"Range({generator.randint(0, 5)},{space(generator)}{generator.randint(5, 9)})"
+                )
+            case _:
+                parameters.append(operator(generator, alternative, depth - 1))
+
+    separator = "," + space(generator)
+
+    return f"{generator.choice(types)}{space(generator)}({separator.join(parameters)})"
+
+
+def generated(count):
+    generator = random.Random(16)
+
+    return [
+        operator(generator, generator.choice(parser.CONSTRAINTS), 3)
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("code", VALID)
+def test_conformance_valid(code):
+    fast, reference = parser.parse(code), textx_parse(code)
+
+    assert type(fast) is type(reference)
+    assert canonical(fast) == canonical(reference)
+
+    check_parents(fast, None)
+
+
+@pytest.mark.parametrize("code", INVALID)
+def test_conformance_invalid(code):
+    with pytest.raises(Exception):
+        textx_parse(code)
+
+    with pytest.raises(ValueError):
+        parser.parse(code)
+
+
+def test_conformance_generated():
+    for code in generated(300):
+        assert canonical(parser.parse(code)) == canonical(textx_parse(code)), code
+
+
+def test_bool_literals():
+    tree = parser.parse("And(1, 0, True, false)")
+
+    assert tree.parameters == [True, False, True, False]
+    assert all(isinstance(parameter, bool) for parameter in tree.parameters)
+
+
+def test_configure_parser():
+    try:
+        mapping.configure_parser("fast")
+        mapping.configure_cache()
+
+        tree = mapping.parse("Negation(Node.value)")
+
+        assert isinstance(tree, interpreter.Logic)
+        assert not hasattr(tree, "_tx_parser")
+    finally:
+        mapping.configure_parser()
+        mapping.configure_cache()
+
+    with pytest.raises(ValueError):
+        mapping.configure_parser("lark")
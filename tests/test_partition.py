@@ -0,0 +1,112 @@
+import pickle
+import pytest
+import uuid
+
+from solvent import graph, partition, traversal
+from solvent.mapping import batch, registry
+
+
+pytestmark = pytest.mark.parametrize(
+    "feature_model", [[("requires", "Car", "GPS")]], indirect=True
+)
+
+
+def names(subgraph):
+    return sorted(node.name for node in subgraph.nodes)
+
+
+def test_components(feature_model):
+    components = partition.components(feature_model)
+
+    assert sorted(map(names, components)) == [
+        ["Basic", "Calls", "Color", "GPS", "Mobile Phone", "Screen"],
+        ["Car"],
+    ]
+    assert sum(len(component.connections) for component in components) == 5
+
+
+def test_components_without_ignored_types(feature_model):
+    components = partition.components(feature_model, ignore=())
+
+    assert len(components) == 1
+    assert len(components[0].connections) == 6
+
+
+def test_subtrees_under_root(feature_model):
+    root = feature_model.find_nodes(name="Mobile Phone")[0].id
+    subtrees = partition.subtrees(feature_model, root)
+
+    assert sorted(map(names, subtrees)) == [
+        ["Basic", "Color", "Screen"],
+        ["Calls"],
+        ["GPS"],
+    ]
+
+    screen = next(subtree for subtree in subtrees if len(subtree) == 3)
+
+    assert [connection.type for connection in screen.connections] == ["or"]
+    assert sorted(connection.type for connection in screen.external) == [
+        "excludes",
+        "mandatory",
+    ]
+
+
+def test_subtree_view_queries(feature_model):
+    root = feature_model.find_nodes(name="Mobile Phone")[0].id
+    screen = next(
+        subtree
+        for subtree in partition.subtrees(feature_model, root)
+        if len(subtree) == 3
+    )
+    start = feature_model.find_nodes(name="Screen")[0].id
+
+    assert screen.get_node(root) is None
+    assert screen.get_connections_from_destination(start) is None
+    assert len(traversal.descendants(screen, start)) == 2
+
+
+def test_subgraph_pickles_with_external(feature_model):
+    subgraph = partition.subtrees(feature_model)[0]
+    restored = pickle.loads(pickle.dumps(subgraph))
+
+    assert isinstance(restored, partition.SubGraph)
+    assert names(restored) == names(subgraph)
+    assert len(restored.connections) == len(subgraph.connections)
+    assert [connection.id for connection in restored.external] == [
+        connection.id for connection in subgraph.external
+    ]
+    assert restored.external
+    assert isinstance(restored.to_graph(), graph.MGraph)
+
+
+def test_subgraph_after_parent_changes(feature_model):
+    subgraph = partition.subtrees(feature_model)[0]
+    calls = []
+
+    def count(view):
+        calls.append(view)
+
+        return len(view.connections)
+
+    before = subgraph.cached("count", count)
+
+    for connection in subgraph.connections + subgraph.external:
+        feature_model.remove_connection(connection.id)
+
+    assert subgraph.connections == []
+    assert subgraph.external == []
+    assert subgraph.cached("count", count) == 0 != before
+    assert len(calls) == 2
+
+
+def test_subgraph_iteration(feature_model):
+    subgraph = partition.subtrees(feature_model)[0]
+
+    assert list(subgraph.iter_nodes()) == subgraph.nodes
+    assert list(subgraph.iter_connections()) == subgraph.connections
+    assert len(list(batch.iter_select(subgraph, "Node"))) == len(subgraph)
+
+    rules = registry.Registry()
+    rules.register("Node", "Boolean(Node.id)")
+
+    assert len(list(rules.iter_constraints(subgraph))) == len(subgraph)
@@ -0,0 +1,103 @@
+import pytest
+
+from solvent import mapping, modeling
+from solvent.mapping import registry
+
+
+@pytest.fixture
+def rules():
+    rules = registry.Registry()
+    rules.register("Node", "Boolean(Node.value)")
+    rules.register(
+        "Connection:mandatory",
+        "Equivalence(Connection.source.value, Connection.destination.value)",
+    )
+    rules.register(
+        "Connection:optional",
+        "Implication(Connection.destination.value, Connection.source.value)",
+    )
+    rules.register(
+        "Connection:or",
+        "Equivalence(Connection.source.value, Or(Connection.destinations.value))",
+    )
+
+    return rules
+
+
+def test_dispatch_by_type(rules, mgraph):
+    kinds = {
+        connection.type: [type(model) for model in rules.apply(connection)]
+        for connection in mgraph.connections
+    }
+
+    assert kinds == {
+        "mandatory": [modeling.Equivalence],
+        "optional": [modeling.Implication],
+        "or": [modeling.Equivalence],
+        "excludes": [],
+    }
+
+
+def test_generic_rules_apply_to_typed_components(rules, mgraph):
+    rules.register("Node:root", "Negation(Node.value)")
+    root = mgraph.find_nodes(type="root")[0]
+
+    assert [type(model) for model in rules.apply(root)] == [
+        modeling.Boolean,
+        modeling.Negation,
+    ]
+    assert len(rules.apply(mgraph.nodes[1])) == 1
+
+
+def test_dispatch_is_precompiled(rules, mgraph):
+    connection = mgraph.find_connections(type="optional")[0]
+
+    assert rules.dispatch(connection) is rules.dispatch(connection)
+    assert len(rules.dispatch(connection)) == 1
+
+
+def test_register_rejects_invalid(rules):
+    with pytest.raises(ValueError):
+        rules.register("Edge:mandatory", "Negation(true)")
+
+    with pytest.raises(TypeError):
+        rules.register("Connection:requires", "Negation(1, 0)")
+
+    assert "Connection:requires" not in rules
+    assert len(rules) == 4
+
+
+def test_unregister(rules, mgraph):
+    rules.unregister("Connection:or")
+
+    assert "Connection:or" not in rules
+    assert list(rules.rules()) == [
+        "Node",
+        "Connection:mandatory",
+        "Connection:optional",
+    ]
+
+    with pytest.raises(KeyError):
+        rules.unregister("Connection:or")
+
+
+def test_iter_constraints(rules, mgraph):
+    constraints = list(rules.iter_constraints(mgraph))
+
+    assert len(constraints) == 5 + 3
+    assert {id for id, _ in constraints} == {node.id for node in mgraph.nodes} | {
+        connection.id
+        for connection in mgraph.connections
+        if connection.type != "excludes"
+    }
+
+
+def test_registry_with_factory(mgraph):
+    rules = registry.Registry(factory=modeling.Factory())
+    rules.register("Node", "Boolean(Node.value)")
+
+    models = [model for _, model in rules.iter_constraints(mgraph)]
+
+    assert len({id(model) for model in models}) == 2
+    assert models[1] is models[3]
+    assert mapping.registry is registry
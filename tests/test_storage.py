@@ -0,0 +1,152 @@
+import pickle
+import pytest
+import uuid
+
+from solvent import graph, mapping, traversal
+from solvent.mapping import batch
+
+
+@pytest.fixture
+def feature_model():
+    phone = graph.Node(id=uuid.uuid4(), name="Mobile Phone", Selected=True)
+    calls = graph.Node(id=uuid.uuid4(), name="Calls", weight=1.5)
+    screen = graph.Node(id=uuid.uuid4(), name="Screen", tags=["display"])
+    basic = graph.Node(id=uuid.uuid4(), name="Basic", value=None)
+    color = graph.Node(id=uuid.uuid4(), name="Color", value=-3)
+    external = graph.Node(id=uuid.uuid4(), name="External")
+
+    return graph.MGraph.from_components(
+        [phone, calls, screen, basic, color],
+        [
+            graph.Connection(
+                id=uuid.uuid4(), type="mandatory", source=phone, destinations=[calls]
+            ),
+            graph.Connection(
+                id=uuid.uuid4(), type="mandatory", source=phone, destinations=[screen]
+            ),
+            graph.Connection(
+                id=uuid.uuid4(),
+                type="range",
+                minimum=1,
+                maximum=1,
+                source=screen,
+                destinations=[basic, color],
+            ),
+            graph.Connection(
+                id=uuid.uuid4(), type="requires", source=color, destinations=[external]
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def snapshot(feature_model, tmp_path):
+    path = tmp_path / "feature_model.snapshot"
+    feature_model.save_snapshot(str(path))
+
+    with graph.MGraph.open_snapshot(str(path)) as mapped:
+        yield mapped
+
+
+def test_snapshot_nodes(feature_model, snapshot):
+    for node in feature_model.nodes:
+        assert snapshot.get_node(node.id).parameters == node.parameters
+
+    assert len(snapshot.nodes) == len(feature_model.nodes)
+    assert snapshot.get_node(uuid.uuid4()) is None
+
+
+def test_snapshot_connections(feature_model, snapshot):
+    for connection in feature_model.connections:
+        mapped = snapshot.get_connection(connection.id)
+
+        assert mapped.type == connection.type
+        assert mapped.source.id == connection.source.id
+        assert [destination.id for destination in mapped.destinations] == [
+            destination.id for destination in connection.destinations
+        ]
+
+
+def test_snapshot_iteration(feature_model, snapshot):
+    assert [node.id for node in snapshot.iter_nodes()] == [
+        node.id for node in snapshot.nodes
+    ]
+    assert len(list(batch.iter_select(snapshot, "Connection:mandatory"))) == 2
+    assert (
+        len(list(mapping.iter_constraints(snapshot, {"Node": "Boolean(Node.id)"}))) == 5
+    )
+
+
+def test_snapshot_materializes_once(snapshot):
+    node = snapshot.nodes[0]
+
+    assert snapshot.get_node(node.id) is node
+    assert snapshot.get_connections_from_source(node.id)[0].source is snapshot.get_node(
+        node.id
+    )
+
+
+def test_snapshot_adjacency(feature_model, snapshot):
+    for node in feature_model.nodes:
+        expected = feature_model.get_connections_from_source(node.id) or []
+        index = snapshot.node_index(node.id)
+
+        assert [
+            snapshot.connection_id(connection)
+            for connection in snapshot.adjacency().sources.row(index)
+        ] == [connection.id for connection in expected]
+
+
+def test_snapshot_traversal(feature_model, snapshot):
+    root = feature_model.nodes[0].id
+
+    assert traversal.bfs(snapshot, root) == traversal.bfs(feature_model, root)
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(b"not a snapshot")
+
+    with pytest.raises(ValueError):
+        graph.MGraph.open_snapshot(str(path))
+
+
+def test_snapshot_rejects_non_uuid_ids(tmp_path):
+    mgraph = graph.MGraph.from_components([graph.Node(id="phone")], [])
+
+    with pytest.raises(ValueError):
+        mgraph.save_snapshot(str(tmp_path / "ids.snapshot"))
+
+
+def test_snapshot_rejects_unsafe_values(tmp_path):
+    mgraph = graph.MGraph.from_components(
+        [graph.Node(id=uuid.uuid4(), limits=range(3))], []
+    )
+
+    with pytest.raises(ValueError):
+        mgraph.save_snapshot(str(tmp_path / "values.snapshot"))
+
+
+def test_snapshot_nested_values(tmp_path):
+    node = graph.Node(
+        id=uuid.uuid4(), data={"tags": ("a", "b"), "links": [uuid.uuid4()]}
+    )
+    path = str(tmp_path / "nested.snapshot")
+    graph.MGraph.from_components([node], []).save_snapshot(path)
+
+    with graph.MGraph.open_snapshot(path) as mapped:
+        assert mapped.get_node(node.id).data == node.data
+
+
+def test_snapshot_refuses_arbitrary_pickles(feature_model, tmp_path):
+    path = tmp_path / "feature_model.snapshot"
+    feature_model.save_snapshot(str(path))
+
+    stored = pickle.dumps(["display"])
+    forged = b"\x80\x04\x8c\x08builtins\x8c\x05print\x93."
+    path.write_bytes(path.read_bytes().replace(stored, forged.ljust(len(stored), b".")))
+    screen = feature_model.find_nodes(name="Screen")[0]
+
+    with graph.MGraph.open_snapshot(str(path)) as mapped:
+        with pytest.raises(pickle.UnpicklingError):
+            mapped.get_node(screen.id).tags
@@ -0,0 +1,118 @@
+import pytest
+import uuid
+
+from solvent import graph, traversal
+
+
+def names(feature_model, ids):
+    return [feature_model.get_node(id).name for id in ids]
+
+
+def test_bfs(feature_model):
+    order = traversal.bfs(feature_model, feature_model.names["Mobile Phone"])
+
+    assert names(feature_model, order) == [
+        "Mobile Phone",
+        "Calls",
+        "GPS",
+        "Screen",
+        "Basic",
+        "Color",
+    ]
+
+
+def test_dfs(feature_model):
+    order = traversal.dfs(feature_model, feature_model.names["Mobile Phone"])
+
+    assert names(feature_model, order) == [
+        "Mobile Phone",
+        "Calls",
+        "GPS",
+        "Screen",
+        "Basic",
+        "Color",
+    ]
+
+
+def test_descendants_by_type(feature_model):
+    descendants = traversal.descendants(
+        feature_model, feature_model.names["Screen"], ["mandatory", "or"]
+    )
+
+    assert names(feature_model, descendants) == ["Basic", "Color"]
+
+
+def test_ancestors(feature_model):
+    ancestors = traversal.ancestors(
+        feature_model, feature_model.names["Color"], ["mandatory", "optional", "or"]
+    )
+
+    assert names(feature_model, ancestors) == ["Screen", "Mobile Phone"]
+
+
+def test_subtree(feature_model):
+    subtree = traversal.subtree(
+        feature_model, feature_model.names["Screen"], ["mandatory", "or"]
+    )
+
+    assert sorted(node.name for node in subtree.nodes) == ["Basic", "Color", "Screen"]
+    assert len(subtree.connections) == 1
+
+
+def test_topological_sort(feature_model):
+    order = names(feature_model, traversal.topological_sort(feature_model))
+
+    assert order.index("Mobile Phone") < order.index("Screen")
+    assert order.index("Screen") < order.index("Basic")
+    assert order.index("Mobile Phone") < order.index("GPS")
+
+
+def test_cross_tree_skipped_by_default(feature_model):
+    screen = feature_model.names["Screen"]
+
+    assert names(feature_model, traversal.descendants(feature_model, screen)) == [
+        "Basic",
+        "Color",
+    ]
+    assert "GPS" in names(
+        feature_model,
+        traversal.descendants(feature_model, screen, ["or", "excludes"]),
+    )
+
+
+def test_topological_sort_cycle(feature_model):
+    feature_model.add_connection(
+        graph.Connection(
+            id=uuid.uuid4(),
+            type="requires",
+            source=feature_model.get_node(feature_model.names["GPS"]),
+            destinations=[feature_model.get_node(feature_model.names["Basic"])],
+        )
+    )
+
+    assert len(traversal.topological_sort(feature_model)) == 6
+
+    with pytest.raises(ValueError):
+        traversal.topological_sort(
+            feature_model, ["mandatory", "optional", "or", "excludes", "requires"]
+        )
+
+
+def test_memoized_until_mutation(feature_model):
+    root = feature_model.names["Mobile Phone"]
+    descendants = traversal.descendants(feature_model, root)
+
+    assert traversal.descendants(feature_model, root) is descendants
+
+    node = graph.Node(id=uuid.uuid4(), name="Media")
+    feature_model.add_node(node)
+    feature_model.add_connection(
+        graph.Connection(
+            id=uuid.uuid4(),
+            type="optional",
+            source=feature_model.get_node(root),
+            destinations=[node],
+        )
+    )
+
+    assert "Media" in names(feature_model, traversal.descendants(feature_model, root))